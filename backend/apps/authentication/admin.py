@@ -10,6 +10,9 @@ class CustomUserAdmin(UserAdmin):
     list_filter = ('user_type', 'is_verified', 'is_active', 'created_at')
     search_fields = ('email', 'username', 'first_name', 'last_name')
     ordering = ('-created_at',)
+    list_per_page = 50
+    # Skip the unfiltered COUNT(*) that the filtered changelist adds on large user tables
+    show_full_result_count = False
     
     fieldsets = (
         (None, {'fields': ('email', 'password')}),
@@ -32,6 +35,8 @@ class CustomUserAdmin(UserAdmin):
 class UserProfileAdmin(admin.ModelAdmin):
     """User profile admin"""
     list_display = ('user', 'location', 'experience_years', 'created_at')
+    list_select_related = ('user',)
+    raw_id_fields = ('user',)
     list_filter = ('experience_years', 'created_at')
     search_fields = ('user__email', 'user__username', 'location')
     ordering = ('-created_at',)
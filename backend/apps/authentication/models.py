@@ -125,17 +125,20 @@ class User(AbstractUser):
                 'can_post': False
             }
         
+        from apps.payments.models import get_shared_pricing_plan
+        
         subscription = self.active_subscription
+        pricing_plan = get_shared_pricing_plan(subscription.pricing_plan_id)
         return {
             'has_subscription': True,
             'status': subscription.status,
-            'plan': subscription.pricing_plan.name,
-            'plan_type': subscription.pricing_plan.plan_type,
+            'plan': pricing_plan.name,
+            'plan_type': pricing_plan.plan_type,
             'trial': subscription.is_trial,
             'trial_days_remaining': subscription.days_remaining_in_trial,
             'job_posts_remaining': subscription.job_posts_remaining,
             'job_posts_used': subscription.job_posts_used,
-            'job_posts_limit': subscription.pricing_plan.job_posts_per_year,
+            'job_posts_limit': pricing_plan.job_posts_per_year,
             'can_post': self.can_post_job(),
             'billing_interval': subscription.billing_interval,
             'current_period_end': subscription.current_period_end
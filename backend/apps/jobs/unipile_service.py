@@ -1,5 +1,6 @@
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from django.conf import settings
 from django.utils import timezone
@@ -8,6 +9,9 @@ from decouple import config
 
 logger = logging.getLogger(__name__)
 
+# Line prefixes treated as bullet points when formatting job text as HTML
+BULLET_MARKERS = ('•', '-', '*')
+
 
 class UnipileService:
     """Service class for integrating with Unipile API"""
@@ -16,6 +20,7 @@ class UnipileService:
         self.api_key = config('UNIPILE_API_KEY', default='')
         self.base_url = config('UNIPILE_BASE_URL', default='https://api10.unipile.com:14090/api/v1')
         self.webhook_url = config('UNIPILE_WEBHOOK_URL', default='https://0b72c5ff662f.ngrok-free.app/api/jobs/webhooks')
+        self.max_workers = config('UNIPILE_MAX_WORKERS', default=5, cast=int)
         
         if not self.api_key:
             logger.warning("UNIPILE_API_KEY not configured")
@@ -87,9 +92,10 @@ class UnipileService:
             logger.error(f"Failed to get account {account_id}: {e}")
             return None
     
-    def get_linkedin_accounts(self) -> List[Dict[str, Any]]:
-        """Get LinkedIn accounts only"""
-        accounts = self.get_accounts()
+    def get_linkedin_accounts(self, accounts: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Get LinkedIn accounts only, filtering already fetched accounts if given"""
+        if accounts is None:
+            accounts = self.get_accounts()
         return [acc for acc in accounts if acc.get('type', '').upper() == 'LINKEDIN']
     
     def post_to_linkedin(self, account_id: str, content: str, **kwargs) -> Optional[Dict[str, Any]]:
@@ -124,7 +130,7 @@ class UnipileService:
         
         try:
             # Search for location ID
-            locations = self.search_linkedin_locations(account_id, job_data.get('location', ''))
+            locations = self.search_linkedin_locations(account_id, job_data.get('location', ''), limit=1)
             if locations:
                 location_id = locations[0].get('id')
                 logger.info(f"Found location ID: {location_id} for '{job_data.get('location')}'")
@@ -298,13 +304,15 @@ class UnipileService:
             logger.error(f"Failed to get job applicants for {job_id}: {e}")
             return []
     
-    def get_linkedin_search_parameters(self, account_id: str, param_type: str = "LOCATION") -> List[Dict[str, Any]]:
+    def get_linkedin_search_parameters(self, account_id: str, param_type: str = "LOCATION", limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get LinkedIn search parameters (locations, job titles, companies)"""
         try:
             params = {
                 "account_id": account_id,
                 "type": param_type
             }
+            if limit:
+                params["limit"] = limit
             response = self._make_request('GET', '/linkedin/search/parameters', params=params)
             return response.get('items', []) if response else []
         except Exception as e:
@@ -337,7 +345,7 @@ class UnipileService:
         
         return results
     
-    def search_linkedin_locations(self, account_id: str, query: str = "") -> List[Dict[str, Any]]:
+    def search_linkedin_locations(self, account_id: str, query: str = "", limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Search for LinkedIn locations by query"""
         try:
             params = {
@@ -345,13 +353,16 @@ class UnipileService:
                 "type": "LOCATION",
                 "keywords": query
             }
+            if limit:
+                params["limit"] = limit
             response = self._make_request('GET', '/linkedin/search/parameters', params=params)
             return response.get('items', []) if response else []
         except Exception as e:
             logger.error(f"Failed to search LinkedIn locations: {e}")
             return []
     
-    def _map_workplace_type(self, job_type: str) -> str:
+    @staticmethod
+    def _map_workplace_type(job_type: str) -> str:
         """Map job type to LinkedIn workplace type"""
         workplace_mapping = {
             'remote': 'REMOTE',
@@ -364,7 +375,8 @@ class UnipileService:
         }
         return workplace_mapping.get(job_type, 'ON_SITE')
     
-    def _map_employment_status(self, job_type: str) -> str:
+    @staticmethod
+    def _map_employment_status(job_type: str) -> str:
         """Map job type to LinkedIn employment status"""
         employment_mapping = {
             'full_time': 'FULL_TIME',
@@ -377,7 +389,8 @@ class UnipileService:
         }
         return employment_mapping.get(job_type, 'FULL_TIME')
     
-    def _map_answer_type(self, question_type: str) -> str:
+    @staticmethod
+    def _map_answer_type(question_type: str) -> str:
         """Map question type to LinkedIn answer type"""
         # According to the API error, only 'numeric' and 'multiple_choices' are valid
         type_mapping = {
@@ -452,7 +465,8 @@ class UnipileService:
         
         return html_description.strip()
     
-    def _format_text_to_html(self, text: str) -> str:
+    @staticmethod
+    def _format_text_to_html(text: str) -> str:
         """Convert plain text with bullet points to HTML"""
         if not text:
             return ""
@@ -464,7 +478,7 @@ class UnipileService:
         
         for line in lines:
             line = line.strip()
-            if line.startswith('•') or line.startswith('-') or line.startswith('*'):
+            if line.startswith(BULLET_MARKERS):
                 if not in_list:
                     html_lines.append('<ul>')
                     in_list = True
@@ -520,11 +534,10 @@ class UnipileService:
             ('users_relations', 'Users Relations events'),
         ]
         
-        results = {}
-        
-        for webhook_type, description in webhook_types:
-            success = self.create_webhook(webhook_type, description)
-            results[webhook_type] = success
+        # Each registration is an independent HTTPS call, so run them concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            successes = executor.map(lambda webhook: self.create_webhook(*webhook), webhook_types)
+            results = dict(zip((webhook_type for webhook_type, _ in webhook_types), successes))
         
         return results
     
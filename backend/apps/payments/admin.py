@@ -1,14 +1,44 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils import timezone
-from .models import PricingPlan, Customer, Subscription, PaymentMethod, Invoice
+from django.db.models import Case, DurationField, ExpressionWrapper, F, FloatField, Value, When
+from django.db.models.functions import Cast, Now
+from .models import PricingPlan, Customer, Subscription, PaymentMethod, Invoice, PendingSubscription
+
+
+class ProjectedChangeList(ChangeList):
+    """Changelist that lets its model admin trim the selected columns"""
+    
+    def get_queryset(self, request, *args, **kwargs):
+        queryset = super().get_queryset(request, *args, **kwargs)
+        return self.model_admin.get_changelist_projection(queryset)
+
+
+class ChangelistQuerysetMixin:
+    """Limit the changelist queryset to the columns it renders"""
+    
+    changelist_only_fields = ()
+    changelist_defer_fields = ()
+    
+    def get_changelist(self, request, **kwargs):
+        return ProjectedChangeList
+    
+    def get_changelist_projection(self, queryset):
+        if self.changelist_only_fields:
+            queryset = queryset.only(*self.changelist_only_fields)
+        if self.changelist_defer_fields:
+            queryset = queryset.defer(*self.changelist_defer_fields)
+        return queryset
 
 
 @admin.register(PricingPlan)
-class PricingPlanAdmin(admin.ModelAdmin):
+class PricingPlanAdmin(ChangelistQuerysetMixin, admin.ModelAdmin):
     """Admin interface for Pricing Plans"""
     
+    changelist_defer_fields = ('description', 'features')
+    
     list_display = [
         'name', 'plan_type', 'monthly_price', 'yearly_price', 
         'yearly_savings_display', 'job_posts_per_year', 'is_active', 'is_popular'
@@ -47,16 +77,45 @@ class PricingPlanAdmin(admin.ModelAdmin):
     yearly_savings_display.short_description = "Yearly Savings"
 
 
+class BillingCountryFilter(admin.SimpleListFilter):
+    """Billing country filter with a bounded list of lookups"""
+    
+    title = "billing country"
+    parameter_name = 'billing_country'
+    max_lookups = 50
+    
+    def lookups(self, request, model_admin):
+        countries = (
+            Customer.objects.exclude(billing_country__isnull=True)
+            .exclude(billing_country='')
+            .order_by('billing_country')
+            .values_list('billing_country', flat=True)
+            .distinct()[:self.max_lookups]
+        )
+        return [(code, code.upper()) for code in countries]
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(billing_country=self.value())
+        return queryset
+
+
 @admin.register(Customer)
-class CustomerAdmin(admin.ModelAdmin):
+class CustomerAdmin(ChangelistQuerysetMixin, admin.ModelAdmin):
     """Admin interface for Customers"""
     
+    changelist_only_fields = (
+        'id', 'email', 'name', 'stripe_customer_id', 'billing_country',
+        'created_at', 'user', 'user__email'
+    )
+    
     list_display = [
         'email', 'name', 'user_link', 'stripe_customer_id', 
         'active_subscriptions_count', 'created_at'
     ]
-    list_filter = ['created_at', 'billing_country']
-    search_fields = ['email', 'name', 'stripe_customer_id', 'user__email']
+    list_select_related = ['user']
+    list_filter = ['created_at', BillingCountryFilter]
+    search_fields = ['email', 'name', 'stripe_customer_id', 'user__email', 'billing_country']
     readonly_fields = ['id', 'created_at', 'updated_at', 'user_link', 'active_subscriptions_count']
     
     fieldsets = (
@@ -98,13 +157,16 @@ class CustomerAdmin(admin.ModelAdmin):
 
 
 @admin.register(Subscription)
-class SubscriptionAdmin(admin.ModelAdmin):
+class SubscriptionAdmin(ChangelistQuerysetMixin, admin.ModelAdmin):
     """Admin interface for Subscriptions"""
     
+    changelist_defer_fields = ('metadata',)
+    
     list_display = [
         'customer_email', 'pricing_plan', 'status', 'billing_interval',
         'trial_status', 'usage_display', 'current_period_end', 'created_at'
     ]
+    list_select_related = ['customer', 'pricing_plan']
     list_filter = [
         'status', 'billing_interval', 'pricing_plan__plan_type', 
         'created_at', 'cancel_at_period_end'
@@ -150,10 +212,23 @@ class SubscriptionAdmin(admin.ModelAdmin):
         })
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            period_remaining=ExpressionWrapper(
+                F('current_period_end') - Now(), output_field=DurationField()
+            ),
+            usage_percentage=Case(
+                When(pricing_plan__job_posts_per_year=0, then=Value(0.0)),
+                default=Cast('job_posts_used', FloatField()) * 100 / F('pricing_plan__job_posts_per_year'),
+                output_field=FloatField(),
+            ),
+        )
+    
     def customer_email(self, obj):
         """Display customer email"""
         return obj.customer.email
     customer_email.short_description = "Customer"
+    customer_email.admin_order_field = 'customer__email'
     
     def trial_status(self, obj):
         """Display trial status"""
@@ -169,18 +244,25 @@ class SubscriptionAdmin(admin.ModelAdmin):
     
     def usage_display(self, obj):
         """Display usage information"""
-        percentage = (obj.job_posts_used / obj.pricing_plan.job_posts_per_year) * 100 if obj.pricing_plan.job_posts_per_year > 0 else 0
+        posts_limit = obj.pricing_plan.job_posts_per_year
+        percentage = getattr(obj, 'usage_percentage', None)
+        if percentage is None:
+            percentage = (obj.job_posts_used / posts_limit) * 100 if posts_limit > 0 else 0
         color = 'green' if percentage < 50 else 'orange' if percentage < 80 else 'red'
         return format_html(
             '<span style="color: {};">{}/{} ({}%)</span>',
-            color, obj.job_posts_used, obj.pricing_plan.job_posts_per_year, round(percentage, 1)
+            color, obj.job_posts_used, posts_limit, round(percentage, 1)
         )
     usage_display.short_description = "Usage"
+    usage_display.admin_order_field = 'usage_percentage'
     
     def days_remaining_display(self, obj):
         """Display days remaining in current period"""
         if obj.current_period_end:
-            remaining = (obj.current_period_end - timezone.now()).days
+            period_remaining = getattr(obj, 'period_remaining', None)
+            if period_remaining is None:
+                period_remaining = obj.current_period_end - timezone.now()
+            remaining = period_remaining.days
             return f"{remaining} days" if remaining > 0 else "Expired"
         return "-"
     days_remaining_display.short_description = "Days Remaining"
@@ -194,6 +276,7 @@ class PaymentMethodAdmin(admin.ModelAdmin):
         'customer_email', 'type', 'card_display', 'is_default', 
         'is_active', 'created_at'
     ]
+    list_select_related = ['customer']
     list_filter = ['type', 'is_default', 'is_active', 'card_brand']
     search_fields = ['customer__email', 'stripe_payment_method_id', 'card_last4']
     readonly_fields = ['id', 'created_at', 'updated_at', 'card_display']
@@ -218,6 +301,7 @@ class PaymentMethodAdmin(admin.ModelAdmin):
         """Display customer email"""
         return obj.customer.email
     customer_email.short_description = "Customer"
+    customer_email.admin_order_field = 'customer__email'
     
     def card_display(self, obj):
         """Display card information"""
@@ -229,13 +313,16 @@ class PaymentMethodAdmin(admin.ModelAdmin):
 
 
 @admin.register(Invoice)
-class InvoiceAdmin(admin.ModelAdmin):
+class InvoiceAdmin(ChangelistQuerysetMixin, admin.ModelAdmin):
     """Admin interface for Invoices"""
     
+    changelist_defer_fields = ('description', 'metadata')
+    
     list_display = [
         'invoice_number_display', 'customer_email', 'status', 
         'total_display', 'invoice_date', 'due_date', 'paid_at'
     ]
+    list_select_related = ['customer']
     list_filter = ['status', 'invoice_date', 'currency']
     search_fields = [
         'stripe_invoice_id', 'invoice_number', 'customer__email', 
@@ -280,6 +367,7 @@ class InvoiceAdmin(admin.ModelAdmin):
         """Display customer email"""
         return obj.customer.email
     customer_email.short_description = "Customer"
+    customer_email.admin_order_field = 'customer__email'
     
     def invoice_number_display(self, obj):
         """Display invoice number or Stripe ID"""
@@ -290,10 +378,23 @@ class InvoiceAdmin(admin.ModelAdmin):
         """Display total amount in dollars"""
         return f"${obj.total_dollars:.2f}"
     total_display.short_description = "Total"
+    total_display.admin_order_field = 'total_dollars'
     
     def amount_due_display(self, obj):
         """Display amount due in dollars"""
         return f"${obj.amount_due_dollars:.2f}"
     amount_due_display.short_description = "Amount Due"
+    amount_due_display.admin_order_field = 'amount_due_dollars'
 # Note: Stripe products are managed directly in Stripe, 
 # so no Django models are needed for basic product management.
+
+
+@admin.register(PendingSubscription)
+class PendingSubscriptionAdmin(admin.ModelAdmin):
+    """Admin interface for Pending Subscriptions"""
+    
+    list_display = ['id', 'user', 'status', 'created_at', 'updated_at']
+    list_select_related = ['user']
+    list_filter = ['status', 'created_at']
+    search_fields = ['id', 'user__email']
+    readonly_fields = ['id', 'user', 'request_data', 'status', 'result', 'created_at', 'updated_at']
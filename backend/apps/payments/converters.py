@@ -0,0 +1,15 @@
+"""
+URL path converters for Stripe Payments
+"""
+
+
+class StripeProductIDConverter:
+    """Match Stripe product IDs so malformed IDs 404 at routing, before any Stripe call"""
+
+    regex = r"prod_[A-Za-z0-9]+"
+
+    def to_python(self, value):
+        return value
+
+    def to_url(self, value):
+        return value
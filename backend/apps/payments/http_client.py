@@ -0,0 +1,50 @@
+"""
+HTTP client for Stripe API calls
+"""
+
+import ssl
+
+import stripe
+
+
+class HTTP2Client(stripe.HTTPXClient):
+    """
+    Stripe HTTP client that multiplexes requests over a single HTTP/2 connection
+
+    Concurrent calls (e.g. the price creation in setup_pricing_plans) share one
+    TLS connection instead of opening one each. Only synchronous requests are
+    supported, since StripeService never uses the async API.
+    """
+
+    def __init__(self, timeout=80, **kwargs):
+        # Skip HTTPXClient.__init__, which would also open an async client we never use
+        stripe.HTTPClient.__init__(self, **kwargs)
+
+        import httpx
+
+        self.httpx = httpx
+        self._timeout = timeout
+
+        verify = (
+            ssl.create_default_context(cafile=stripe.ca_bundle_path)
+            if self._verify_ssl_certs
+            else False
+        )
+
+        # httpx only accepts proxies per client, not per request, so route them
+        # through transports here instead of letting HTTPXClient pass them on
+        proxies = self._proxy or {}
+        self._proxy = None
+        mounts = {
+            f"{scheme}://": httpx.HTTPTransport(http2=True, verify=verify, proxy=url)
+            for scheme, url in proxies.items()
+        }
+
+        self._client = httpx.Client(http2=True, verify=verify, mounts=mounts)
+        self._client_async = None
+
+    async def request_async(self, *args, **kwargs):
+        raise RuntimeError("Stripe: HTTP2Client only supports synchronous requests.")
+
+    async def close_async(self):
+        pass
@@ -0,0 +1,56 @@
+"""
+Set up the RecruiterAI pricing plans in Stripe and store them in the database
+"""
+
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.payments.models import PricingPlan
+from apps.payments.stripe_service import PRICING_PLANS, stripe_service
+
+
+class Command(BaseCommand):
+    help = "Create the pricing plan products and prices in Stripe and save their IDs to PricingPlan"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--refresh",
+            action="store_true",
+            help="Look the plans up in Stripe instead of reusing cached product and price IDs",
+        )
+
+    def handle(self, *args, **options):
+        result = stripe_service.setup_pricing_plans(refresh=options["refresh"])
+        if not result["success"]:
+            raise CommandError(f"{result['message']}: {result['error']}")
+
+        plan_definitions = {plan["metadata"]["plan_type"]: plan for plan in PRICING_PLANS}
+
+        for plan in result["plans"]:
+            plan_type = plan["product"]["metadata"]["plan_type"]
+            plan_data = plan_definitions[plan_type]
+
+            if plan["monthly_price"] is None or plan["yearly_price"] is None:
+                self.stderr.write(f"Skipping {plan['plan_name']}: Stripe prices could not be created")
+                continue
+
+            _, created = PricingPlan.objects.update_or_create(
+                plan_type=plan_type,
+                defaults={
+                    "name": plan_data["name"],
+                    "description": plan_data["description"],
+                    "monthly_price": Decimal(plan_data["monthly_price"]) / 100,
+                    "yearly_price": Decimal(plan_data["yearly_price"]) / 100,
+                    "stripe_product_id": plan["product"]["id"],
+                    "stripe_monthly_price_id": plan["monthly_price"]["id"],
+                    "stripe_yearly_price_id": plan["yearly_price"]["id"],
+                    "job_posts_per_year": int(plan_data["metadata"]["job_posts_per_year"]),
+                    "trial_days": int(plan_data["metadata"]["trial_days"]),
+                    "support_level": plan_data["metadata"]["support_level"],
+                    "features": list(plan_data["features"]),
+                },
+            )
+            self.stdout.write(f"{'Created' if created else 'Updated'} {plan['plan_name']} plan")
+
+        self.stdout.write(self.style.SUCCESS("Pricing plans setup completed"))
@@ -1,11 +1,22 @@
 from django.db import models
+from django.db.models import Case, F, OuterRef, Subquery, Value, When
+from django.db.models.functions import Greatest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator, MaxValueValidator
+from collections import namedtuple
+from decimal import Decimal
 import uuid
 
 User = get_user_model()
 
+# Lightweight snapshot of the pricing plan fields read on hot paths
+PricingPlanInfo = namedtuple('PricingPlanInfo', ['id', 'name', 'plan_type', 'job_posts_per_year'])
+
+PRICING_PLAN_CACHE_TIMEOUT = 60  # seconds
+
 
 class PricingPlan(models.Model):
     """Model to store pricing plan information"""
@@ -39,9 +50,9 @@ class PricingPlan(models.Model):
     )
     
     # Stripe IDs
-    stripe_product_id = models.CharField(max_length=255, blank=True, null=True)
-    stripe_monthly_price_id = models.CharField(max_length=255, blank=True, null=True)
-    stripe_yearly_price_id = models.CharField(max_length=255, blank=True, null=True)
+    stripe_product_id = models.CharField(max_length=255, blank=True, null=True, db_index=True)
+    stripe_monthly_price_id = models.CharField(max_length=255, blank=True, null=True, db_index=True)
+    stripe_yearly_price_id = models.CharField(max_length=255, blank=True, null=True, db_index=True)
     
     # Plan limits and features
     job_posts_per_year = models.PositiveIntegerField(help_text="Number of job posts allowed per year")
@@ -82,6 +93,33 @@ class PricingPlan(models.Model):
         return (self.monthly_price * 12) - self.yearly_price
 
 
+def _load_pricing_plan(pk):
+    """Fetch the pricing plan snapshot from the database"""
+    return PricingPlanInfo(
+        *PricingPlan.objects.values_list(*PricingPlanInfo._fields).get(pk=pk)
+    )
+
+
+def get_shared_pricing_plan(pk):
+    """
+    Get a pricing plan snapshot from the Django cache
+    
+    Shared between processes when a shared cache backend is configured,
+    and expires after PRICING_PLAN_CACHE_TIMEOUT seconds.
+    """
+    cache_key = f"payments:pricing_plan:{pk}"
+    plan = cache.get(cache_key)
+    if plan is None:
+        plan = _load_pricing_plan(pk)
+        cache.set(cache_key, plan, PRICING_PLAN_CACHE_TIMEOUT)
+    return plan
+
+
+def clear_pricing_plan_cache(pk):
+    """Drop a pricing plan from the Django cache"""
+    cache.delete(f"payments:pricing_plan:{pk}")
+
+
 class Customer(models.Model):
     """Model to store customer information for Stripe integration"""
     
@@ -100,7 +138,7 @@ class Customer(models.Model):
     billing_city = models.CharField(max_length=100, blank=True, null=True)
     billing_state = models.CharField(max_length=100, blank=True, null=True)
     billing_postal_code = models.CharField(max_length=20, blank=True, null=True)
-    billing_country = models.CharField(max_length=2, blank=True, null=True)  # ISO country code
+    billing_country = models.CharField(max_length=2, blank=True, null=True, db_index=True)  # ISO country code
     
     # Metadata
     metadata = models.JSONField(default=dict, blank=True)
@@ -138,7 +176,7 @@ class Subscription(models.Model):
     
     # Stripe information
     stripe_subscription_id = models.CharField(max_length=255, unique=True)
-    stripe_price_id = models.CharField(max_length=255)
+    stripe_price_id = models.CharField(max_length=255, db_index=True)
     
     # Subscription details
     status = models.CharField(max_length=20, choices=STATUS_CHOICES)
@@ -175,6 +213,12 @@ class Subscription(models.Model):
         verbose_name = _("Subscription")
         verbose_name_plural = _("Subscriptions")
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'billing_interval']),
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['customer', 'status']),
+            models.Index(fields=['current_period_end']),
+        ]
     
     def __str__(self):
         return f"{self.customer.email} - {self.pricing_plan.name} ({self.status})"
@@ -193,22 +237,102 @@ class Subscription(models.Model):
     def days_remaining_in_trial(self):
         """Calculate days remaining in trial"""
         if self.trial_end and self.is_trial:
-            from django.utils import timezone
             remaining = self.trial_end - timezone.now()
             return max(0, remaining.days)
         return 0
     
     def update_usage(self, posts_used=1):
         """Update job posts usage"""
-        self.job_posts_used += posts_used
-        self.job_posts_remaining = max(0, self.pricing_plan.job_posts_per_year - self.job_posts_used)
-        self.save(update_fields=['job_posts_used', 'job_posts_remaining', 'updated_at'])
+        Subscription.bulk_update_usage({self.pk: posts_used})
+        # Reload what the UPDATE wrote so concurrent usage is reflected too
+        self.refresh_from_db(fields=['job_posts_used', 'job_posts_remaining', 'updated_at'])
+    
+    @classmethod
+    def bulk_update_usage(cls, usage):
+        """
+        Apply job posts usage for several subscriptions in a single UPDATE
+        
+        Args:
+            usage: Mapping of subscription ID to number of job posts used
+        
+        Returns:
+            Number of subscriptions updated
+        """
+        if not usage:
+            return 0
+        
+        posts_used = Case(
+            *[When(pk=pk, then=Value(count)) for pk, count in usage.items()],
+            default=Value(0),
+            output_field=models.IntegerField(),
+        )
+        return cls.objects.filter(pk__in=usage).update(
+            job_posts_used=F('job_posts_used') + posts_used,
+            job_posts_remaining=Greatest(
+                cls._job_posts_limit() - F('job_posts_used') - posts_used,
+                Value(0),
+                output_field=models.IntegerField(),
+            ),
+            updated_at=timezone.now(),
+        )
+    
+    @staticmethod
+    def _job_posts_limit():
+        """Subquery for the yearly job posts limit of the subscription's plan"""
+        return Subquery(
+            PricingPlan.objects.filter(pk=OuterRef('pricing_plan_id')).order_by().values('job_posts_per_year')[:1]
+        )
+    
+    @classmethod
+    def bulk_upsert(cls, subscriptions, batch_size=500):
+        """
+        Insert or update subscriptions synced from Stripe in bulk
+        
+        Rows are matched on stripe_subscription_id. Usage counters are
+        tracked locally and are left untouched on existing rows.
+        
+        Args:
+            subscriptions: Unsaved Subscription instances
+            batch_size: Number of rows per INSERT statement
+        
+        Returns:
+            List of Subscription instances
+        """
+        return cls.objects.bulk_create(
+            subscriptions,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['stripe_subscription_id'],
+            update_fields=[
+                'pricing_plan', 'stripe_price_id', 'status', 'billing_interval',
+                'unit_amount', 'currency', 'current_period_start', 'current_period_end',
+                'trial_start', 'trial_end', 'cancel_at_period_end', 'canceled_at',
+                'metadata', 'updated_at',
+            ],
+        )
     
     def reset_usage(self):
         """Reset usage counters (called on renewal)"""
+        Subscription.reset_usage_bulk([self.pk])
         self.job_posts_used = 0
-        self.job_posts_remaining = self.pricing_plan.job_posts_per_year
-        self.save(update_fields=['job_posts_used', 'job_posts_remaining', 'updated_at'])
+        self.job_posts_remaining = get_shared_pricing_plan(self.pricing_plan_id).job_posts_per_year
+    
+    @classmethod
+    def reset_usage_bulk(cls, subscription_ids):
+        """
+        Reset usage counters for several subscriptions in a single UPDATE
+        
+        Args:
+            subscription_ids: IDs of the renewed subscriptions
+        
+        Returns:
+            Number of subscriptions updated
+        """
+        return cls.objects.filter(pk__in=subscription_ids).update(
+            job_posts_used=0,
+            job_posts_remaining=cls._job_posts_limit(),
+            updated_at=timezone.now(),
+        )
 
 
 class PaymentMethod(models.Model):
@@ -251,6 +375,9 @@ class PaymentMethod(models.Model):
         verbose_name = _("Payment Method")
         verbose_name_plural = _("Payment Methods")
         ordering = ['-is_default', '-created_at']
+        indexes = [
+            models.Index(fields=['customer', 'is_default']),
+        ]
     
     def __str__(self):
         if self.type == 'card' and self.card_last4:
@@ -287,6 +414,22 @@ class Invoice(models.Model):
     tax = models.PositiveIntegerField(default=0, help_text="Tax amount in cents")
     total = models.PositiveIntegerField(help_text="Total amount in cents")
     
+    # Dollar amounts (denormalized from the cent amounts on save)
+    amount_due_dollars = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        editable=False,
+        help_text="Amount due in USD"
+    )
+    total_dollars = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        editable=False,
+        help_text="Total amount in USD"
+    )
+    
     currency = models.CharField(max_length=3, default='usd')
     
     # Dates
@@ -310,16 +453,89 @@ class Invoice(models.Model):
         verbose_name = _("Invoice")
         verbose_name_plural = _("Invoices")
         ordering = ['-invoice_date']
+        indexes = [
+            models.Index(fields=['status', '-invoice_date']),
+            models.Index(fields=['customer', '-invoice_date']),
+        ]
     
     def __str__(self):
         return f"Invoice {self.invoice_number or self.stripe_invoice_id} - {self.customer.email}"
     
-    @property
-    def amount_due_dollars(self):
-        """Convert amount due from cents to dollars"""
-        return self.amount_due / 100
+    def save(self, *args, **kwargs):
+        """Keep the dollar amounts in sync with the cent amounts"""
+        self.sync_dollar_amounts()
+        
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if 'amount_due' in update_fields:
+                update_fields.add('amount_due_dollars')
+            if 'total' in update_fields:
+                update_fields.add('total_dollars')
+            kwargs['update_fields'] = update_fields
+        
+        super().save(*args, **kwargs)
+    
+    def sync_dollar_amounts(self):
+        """Set the dollar amounts from the cent amounts"""
+        self.amount_due_dollars = Decimal(self.amount_due) / 100
+        self.total_dollars = Decimal(self.total) / 100
+    
+    @classmethod
+    def bulk_upsert(cls, invoices, batch_size=500):
+        """
+        Insert or update invoices synced from Stripe in bulk
+        
+        Rows are matched on stripe_invoice_id.
+        
+        Args:
+            invoices: Unsaved Invoice instances
+            batch_size: Number of rows per INSERT statement
+        
+        Returns:
+            List of Invoice instances
+        """
+        for invoice in invoices:
+            invoice.sync_dollar_amounts()
+        
+        return cls.objects.bulk_create(
+            invoices,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['stripe_invoice_id'],
+            update_fields=[
+                'subscription', 'invoice_number', 'status', 'amount_due', 'amount_paid',
+                'subtotal', 'tax', 'total', 'amount_due_dollars', 'total_dollars',
+                'currency', 'due_date', 'paid_at', 'hosted_invoice_url', 'invoice_pdf_url',
+                'description', 'metadata', 'updated_at',
+            ],
+        )
+
+
+class PendingSubscription(models.Model):
+    """Subscription request queued for creation in Stripe by a background task"""
     
-    @property
-    def total_dollars(self):
-        """Convert total from cents to dollars"""
-        return self.total / 100
\ No newline at end of file
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('succeeded', 'Succeeded'),
+        ('failed', 'Failed'),
+    ]
+    
+    # Also used as the Stripe idempotency key, so retried tasks never create duplicates
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='pending_subscriptions')
+    request_data = models.JSONField(default=dict, help_text="Validated subscription request")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    result = models.JSONField(default=dict, blank=True, help_text="Stripe customer and subscription result")
+    
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = _("Pending Subscription")
+        verbose_name_plural = _("Pending Subscriptions")
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"Pending subscription {self.id} - {self.status}"
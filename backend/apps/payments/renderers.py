@@ -0,0 +1,19 @@
+"""
+Renderers for Stripe Payment APIs
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer backed by orjson"""
+
+    # Fall back to DRF's encoder for types orjson does not handle (Decimal, lazy strings, ...)
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=self.encoder.default)
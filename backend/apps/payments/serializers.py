@@ -193,3 +193,18 @@ class CreateSubscriptionResponseSerializer(serializers.Serializer):
     subscription = SubscriptionResponseSerializer(required=False, help_text="Subscription details")
     customer = serializers.DictField(required=False, help_text="Customer details")
     error = serializers.CharField(required=False, help_text="Error message if failed")
+
+
+class SubscriptionTaskResponseSerializer(serializers.Serializer):
+    """Serializer for queued subscription response"""
+    
+    success = serializers.BooleanField(help_text="Whether the operation was successful")
+    message = serializers.CharField(help_text="Response message")
+    task_id = serializers.UUIDField(required=False, help_text="Queued subscription request ID")
+    status = serializers.ChoiceField(
+        choices=["queued", "succeeded", "failed"],
+        required=False,
+        help_text="Subscription request status"
+    )
+    result = CreateSubscriptionResponseSerializer(required=False, help_text="Stripe result once processed")
+    error = serializers.DictField(required=False, help_text="Validation errors if failed")
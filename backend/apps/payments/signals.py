@@ -0,0 +1,14 @@
+"""
+Signal handlers for the payments app
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import PricingPlan, clear_pricing_plan_cache
+
+
+@receiver([post_save, post_delete], sender=PricingPlan)
+def invalidate_pricing_plan_cache(sender, instance, **kwargs):
+    """Drop cached pricing plan snapshots when a plan changes"""
+    clear_pricing_plan_cache(instance.pk)
@@ -2,19 +2,161 @@
 Stripe Service for handling payment operations
 """
 
-import stripe
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
 from decouple import config
 
+logger = logging.getLogger(__name__)
+
+# Read once at import instead of on every StripeService instantiation
+_SECRET_KEY = config("STRIPE_SECRET_KEY", default="")
+PUBLISHABLE_KEY = config("STRIPE_PUBLISHABLE_KEY", default="")
+_WEBHOOK_SECRET = config("STRIPE_WEBHOOK_SECRET", default="")
+
+# How long resolved pricing plan products/prices stay cached
+STRIPE_PLAN_CACHE_TIMEOUT = 60 * 60 * 24  # seconds
+
+# How long product reads stay cached (invalidated early by writes and webhooks)
+PRODUCT_CACHE_TIMEOUT = 60 * 5  # seconds
+PRODUCT_LIST_VERSION_CACHE_KEY = "stripe:products:version"
+
+# How long the last good product reads are kept to serve while Stripe is unavailable
+PRODUCT_STALE_CACHE_TIMEOUT = 60 * 60 * 24  # seconds
+
+# Network retries for idempotent requests, which Stripe can safely replay
+IDEMPOTENT_MAX_NETWORK_RETRIES = 3
+
+# RecruiterAI pricing plans, as set up in Stripe
+PRICING_PLANS = (
+    {
+        "name": "Starter",
+        "description": "Perfect for small businesses",
+        "features": (
+            "36 job posts per year",
+            "Priority email support",
+            "Advanced analytics",
+            "7-day free trial (1 job post)",
+        ),
+        "monthly_price": 18231,  # $182.31 in cents
+        "yearly_price": 218777,  # $2,187.77 in cents
+        "metadata": MappingProxyType({
+            "plan_type": "starter",
+            "job_posts_per_year": "36",
+            "support_level": "email",
+            "trial_days": "7",
+        }),
+    },
+    {
+        "name": "Standard",
+        "description": "Perfect for growing teams",
+        "features": (
+            "120 job posts per year",
+            "Priority email support",
+            "Advanced analytics",
+            "Team collaboration tools",
+            "7-day free trial (1 job post)",
+        ),
+        "monthly_price": 24666,  # $246.66 in cents
+        "yearly_price": 295992,  # $2,959.92 in cents
+        "metadata": MappingProxyType({
+            "plan_type": "standard",
+            "job_posts_per_year": "120",
+            "support_level": "email",
+            "trial_days": "7",
+        }),
+    },
+    {
+        "name": "Enterprise",
+        "description": "Perfect for large organizations",
+        "features": (
+            "360 job posts per year",
+            "Priority email support",
+            "Advanced analytics",
+            "Team collaboration tools",
+            "7-day free trial (1 job post)",
+        ),
+        "monthly_price": 34318,  # $343.18 in cents
+        "yearly_price": 411815,  # $4,118.15 in cents
+        "metadata": MappingProxyType({
+            "plan_type": "enterprise",
+            "job_posts_per_year": "360",
+            "support_level": "email",
+            "trial_days": "7",
+        }),
+    },
+)
+
+
+# Response fields copied from each Stripe object type
+PRODUCT_FIELDS = (
+    "id", "name", "description", "images", "metadata", "url", "active", "created", "updated",
+)
+PRICE_FIELDS = (
+    "id", "product", "unit_amount", "currency", "recurring", "nickname", "metadata", "active",
+)
+SUBSCRIPTION_FIELDS = (
+    "id", "customer", "status", "current_period_start", "current_period_end",
+    "trial_start", "trial_end", "metadata",
+)
+CUSTOMER_FIELDS = ("id", "email", "name", "metadata")
+
+# Stripe objects are dicts, so itemgetter skips StripeObject.__getattr__ per field
+_get_product_fields = itemgetter(*PRODUCT_FIELDS)
+_get_price_fields = itemgetter(*PRICE_FIELDS)
+_get_subscription_fields = itemgetter(*SUBSCRIPTION_FIELDS)
+_get_customer_fields = itemgetter(*CUSTOMER_FIELDS)
+
+
+def product_to_dict(product) -> Dict[str, Any]:
+    """Convert a Stripe product to a response dict"""
+    data = dict(zip(PRODUCT_FIELDS, _get_product_fields(product)))
+    # Plain dicts pickle far faster than StripeObjects when results are cached
+    data["metadata"] = dict(data["metadata"])
+    return data
+
+
+def price_to_dict(price) -> Dict[str, Any]:
+    """Convert a Stripe price to a response dict"""
+    data = dict(zip(PRICE_FIELDS, _get_price_fields(price)))
+    data["metadata"] = dict(data["metadata"])
+    if data["recurring"] is not None:
+        data["recurring"] = dict(data["recurring"])
+    return data
+
+
+def subscription_to_dict(subscription) -> Dict[str, Any]:
+    """Convert a Stripe subscription to a response dict"""
+    return dict(zip(SUBSCRIPTION_FIELDS, _get_subscription_fields(subscription)))
+
+
+def customer_to_dict(customer) -> Dict[str, Any]:
+    """Convert a Stripe customer to a response dict"""
+    return dict(zip(CUSTOMER_FIELDS, _get_customer_fields(customer)))
+
 
 class StripeService:
     """Service class for Stripe payment operations"""
 
     def __init__(self):
+        # Stripe SDK is imported here so processes that never call Stripe don't load it
+        import stripe
+        from .http_client import HTTP2Client
+
         # Initialize Stripe with secret key
-        stripe.api_key = config("STRIPE_SECRET_KEY", default="")
-        self.publishable_key = config("STRIPE_PUBLISHABLE_KEY", default="")
+        stripe.api_key = _SECRET_KEY
+        stripe.default_http_client = HTTP2Client(
+            verify_ssl_certs=stripe.verify_ssl_certs, proxy=stripe.proxy
+        )
+        self._stripe = stripe
+        self.publishable_key = PUBLISHABLE_KEY
+        self.webhook_secret = _WEBHOOK_SECRET
         
         if not stripe.api_key:
             raise ValueError("STRIPE_SECRET_KEY must be set in environment variables")
@@ -62,25 +204,16 @@ class StripeService:
                 product_data["url"] = url
 
             # Create product in Stripe
-            product = stripe.Product.create(**product_data)
+            product = self._stripe.Product.create(**product_data)
+            self.invalidate_product_cache()
 
             return {
                 "success": True,
-                "product": {
-                    "id": product.id,
-                    "name": product.name,
-                    "description": product.description,
-                    "images": product.images,
-                    "metadata": product.metadata,
-                    "url": product.url,
-                    "active": product.active,
-                    "created": product.created,
-                    "updated": product.updated,
-                },
+                "product": product_to_dict(product),
                 "message": "Product created successfully",
             }
 
-        except stripe.error.StripeError as e:
+        except self._stripe.error.StripeError as e:
             return {
                 "success": False,
                 "error": str(e),
@@ -103,26 +236,29 @@ class StripeService:
         Returns:
             Dict containing product data or error
         """
+        cache_key = f"stripe:product:{product_id}"
+        stale_cache_key = f"{cache_key}:stale"
+        result = cache.get(cache_key)
+        if result is not None:
+            return result
+
         try:
-            product = stripe.Product.retrieve(product_id)
+            product = self._stripe.Product.retrieve(product_id)
 
-            return {
+            result = {
                 "success": True,
-                "product": {
-                    "id": product.id,
-                    "name": product.name,
-                    "description": product.description,
-                    "images": product.images,
-                    "metadata": product.metadata,
-                    "url": product.url,
-                    "active": product.active,
-                    "created": product.created,
-                    "updated": product.updated,
-                },
+                "product": product_to_dict(product),
                 "message": "Product retrieved successfully",
             }
+            cache.set(cache_key, result, PRODUCT_CACHE_TIMEOUT)
+            cache.set(stale_cache_key, result, PRODUCT_STALE_CACHE_TIMEOUT)
+            return result
+
+        except self._stripe.error.StripeError as e:
+            stale_result = self.get_stale_result(stale_cache_key, e)
+            if stale_result is not None:
+                return stale_result
 
-        except stripe.error.StripeError as e:
             return {
                 "success": False,
                 "error": str(e),
@@ -171,26 +307,21 @@ class StripeService:
             if active is not None:
                 update_data["active"] = active
 
+            # Nothing to change, so serve the (possibly cached) product instead of a no-op modify
+            if not update_data:
+                return self.get_product(product_id)
+
             # Update product in Stripe
-            product = stripe.Product.modify(product_id, **update_data)
+            product = self._stripe.Product.modify(product_id, **update_data)
+            self.invalidate_product_cache(product_id)
 
             return {
                 "success": True,
-                "product": {
-                    "id": product.id,
-                    "name": product.name,
-                    "description": product.description,
-                    "images": product.images,
-                    "metadata": product.metadata,
-                    "url": product.url,
-                    "active": product.active,
-                    "created": product.created,
-                    "updated": product.updated,
-                },
+                "product": product_to_dict(product),
                 "message": "Product updated successfully",
             }
 
-        except stripe.error.StripeError as e:
+        except self._stripe.error.StripeError as e:
             return {
                 "success": False,
                 "error": str(e),
@@ -214,6 +345,14 @@ class StripeService:
         Returns:
             Dict containing list of products or error
         """
+        version = cache.get_or_set(PRODUCT_LIST_VERSION_CACHE_KEY, 1, None)
+        cache_key = f"stripe:products:{version}:{limit}:{active}:{starting_after}"
+        # Unversioned, so the last good page survives writes for use during Stripe outages
+        stale_cache_key = f"stripe:products:stale:{limit}:{active}:{starting_after}"
+        result = cache.get(cache_key)
+        if result is not None:
+            return result
+
         try:
             # Prepare list parameters
             list_params = {"limit": min(limit, 100)}
@@ -224,35 +363,69 @@ class StripeService:
                 list_params["starting_after"] = starting_after
 
             # List products from Stripe
-            products = stripe.Product.list(**list_params)
+            products = self._stripe.Product.list(**list_params)
 
-            return {
+            result = {
                 "success": True,
-                "products": [
-                    {
-                        "id": product.id,
-                        "name": product.name,
-                        "description": product.description,
-                        "images": product.images,
-                        "metadata": product.metadata,
-                        "url": product.url,
-                        "active": product.active,
-                        "created": product.created,
-                        "updated": product.updated,
-                    }
-                    for product in products.data
-                ],
+                "products": [product_to_dict(product) for product in products.data],
                 "has_more": products.has_more,
                 "message": "Products retrieved successfully",
             }
+            cache.set(cache_key, result, PRODUCT_CACHE_TIMEOUT)
+            cache.set(stale_cache_key, result, PRODUCT_STALE_CACHE_TIMEOUT)
+            return result
+
+        except self._stripe.error.StripeError as e:
+            stale_result = self.get_stale_result(stale_cache_key, e)
+            if stale_result is not None:
+                return stale_result
 
-        except stripe.error.StripeError as e:
             return {
                 "success": False,
                 "error": str(e),
                 "message": "Failed to list products from Stripe",
             }
 
+    def invalidate_product_cache(self, product_id: Optional[str] = None) -> None:
+        """
+        Drop cached product reads
+
+        Args:
+            product_id: Stripe product ID to drop; product lists are always dropped
+        """
+        if product_id:
+            cache.delete_many([f"stripe:product:{product_id}", f"stripe:product:{product_id}:stale"])
+
+        # Bumping the version orphans every cached product list page
+        try:
+            cache.incr(PRODUCT_LIST_VERSION_CACHE_KEY)
+        except ValueError:
+            cache.set(PRODUCT_LIST_VERSION_CACHE_KEY, 1, None)
+
+    def get_stale_result(self, stale_cache_key: str, error: Exception) -> Optional[Dict[str, Any]]:
+        """
+        Get the last good cached result when Stripe itself is unavailable
+
+        Args:
+            stale_cache_key: Cache key of the last good result
+            error: Error raised by the Stripe call
+
+        Returns:
+            The cached result, or None for request errors or when nothing is cached
+        """
+        unavailable_errors = (
+            self._stripe.error.APIConnectionError,
+            self._stripe.error.APIError,
+            self._stripe.error.RateLimitError,
+        )
+        if not isinstance(error, unavailable_errors):
+            return None
+
+        result = cache.get(stale_cache_key)
+        if result is not None:
+            logger.warning(f"Serving stale {stale_cache_key} while Stripe is unavailable: {error}")
+        return result
+
     def delete_product(self, product_id: str) -> Dict[str, Any]:
         """
         Delete a product from Stripe
@@ -264,7 +437,8 @@ class StripeService:
             Dict containing deletion result or error
         """
         try:
-            product = stripe.Product.delete(product_id)
+            product = self._stripe.Product.delete(product_id)
+            self.invalidate_product_cache(product_id)
 
             return {
                 "success": True,
@@ -273,7 +447,7 @@ class StripeService:
                 "message": "Product deleted successfully",
             }
 
-        except stripe.error.StripeError as e:
+        except self._stripe.error.StripeError as e:
             return {
                 "success": False,
                 "error": str(e),
@@ -316,24 +490,15 @@ class StripeService:
             if metadata:
                 price_data["metadata"] = metadata
 
-            price = stripe.Price.create(**price_data)
+            price = self._stripe.Price.create(**price_data)
 
             return {
                 "success": True,
-                "price": {
-                    "id": price.id,
-                    "product": price.product,
-                    "unit_amount": price.unit_amount,
-                    "currency": price.currency,
-                    "recurring": price.recurring,
-                    "nickname": price.nickname,
-                    "metadata": price.metadata,
-                    "active": price.active,
-                },
+                "price": price_to_dict(price),
                 "message": "Price created successfully",
             }
 
-        except stripe.error.StripeError as e:
+        except self._stripe.error.StripeError as e:
             return {
                 "success": False,
                 "error": str(e),
@@ -346,6 +511,7 @@ class StripeService:
         price_id: str,
         trial_period_days: Optional[int] = None,
         metadata: Optional[Dict[str, str]] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Create a subscription in Stripe
@@ -355,6 +521,7 @@ class StripeService:
             price_id: Stripe price ID
             trial_period_days: Number of trial days
             metadata: Additional metadata
+            idempotency_key: Key that makes retried requests safe
 
         Returns:
             Dict containing subscription data or error
@@ -369,25 +536,19 @@ class StripeService:
                 subscription_data["trial_period_days"] = trial_period_days
             if metadata:
                 subscription_data["metadata"] = metadata
+            if idempotency_key:
+                subscription_data["idempotency_key"] = idempotency_key
+                subscription_data["max_network_retries"] = IDEMPOTENT_MAX_NETWORK_RETRIES
 
-            subscription = stripe.Subscription.create(**subscription_data)
+            subscription = self._stripe.Subscription.create(**subscription_data)
 
             return {
                 "success": True,
-                "subscription": {
-                    "id": subscription.id,
-                    "customer": subscription.customer,
-                    "status": subscription.status,
-                    "current_period_start": subscription.current_period_start,
-                    "current_period_end": subscription.current_period_end,
-                    "trial_start": subscription.trial_start,
-                    "trial_end": subscription.trial_end,
-                    "metadata": subscription.metadata,
-                },
+                "subscription": subscription_to_dict(subscription),
                 "message": "Subscription created successfully",
             }
 
-        except stripe.error.StripeError as e:
+        except self._stripe.error.StripeError as e:
             return {
                 "success": False,
                 "error": str(e),
@@ -399,6 +560,7 @@ class StripeService:
         email: str,
         name: Optional[str] = None,
         metadata: Optional[Dict[str, str]] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Create a customer in Stripe
@@ -407,6 +569,7 @@ class StripeService:
             email: Customer email
             name: Customer name
             metadata: Additional metadata
+            idempotency_key: Key that makes retried requests safe
 
         Returns:
             Dict containing customer data or error
@@ -418,135 +581,179 @@ class StripeService:
                 customer_data["name"] = name
             if metadata:
                 customer_data["metadata"] = metadata
+            if idempotency_key:
+                customer_data["idempotency_key"] = idempotency_key
+                customer_data["max_network_retries"] = IDEMPOTENT_MAX_NETWORK_RETRIES
 
-            customer = stripe.Customer.create(**customer_data)
+            customer = self._stripe.Customer.create(**customer_data)
 
             return {
                 "success": True,
-                "customer": {
-                    "id": customer.id,
-                    "email": customer.email,
-                    "name": customer.name,
-                    "metadata": customer.metadata,
-                },
+                "customer": customer_to_dict(customer),
                 "message": "Customer created successfully",
             }
 
-        except stripe.error.StripeError as e:
+        except self._stripe.error.StripeError as e:
             return {
                 "success": False,
                 "error": str(e),
                 "message": "Failed to create customer in Stripe",
             }
 
-    def setup_pricing_plans(self) -> Dict[str, Any]:
+    def find_plan_product(self, plan_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the active product tagged with a pricing plan type
+
+        Args:
+            plan_type: Value of the product's plan_type metadata
+
+        Returns:
+            Dict containing product data, or None if no product matches
+        """
+        products = self._stripe.Product.search(
+            query=f"active:'true' AND metadata['plan_type']:'{plan_type}'",
+            limit=1,
+        )
+        if not products.data:
+            return None
+
+        product = products.data[0]
+        return {
+            "success": True,
+            "product": product_to_dict(product),
+            "message": "Product retrieved successfully",
+        }
+
+    def find_plan_price(self, product_id: str, billing_interval: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the active price of a product for a billing interval
+
+        Args:
+            product_id: Stripe product ID
+            billing_interval: Value of the price's billing_interval metadata
+
+        Returns:
+            Dict containing price data, or None if no price matches
+        """
+        prices = self._stripe.Price.search(
+            query=(
+                f"active:'true' AND product:'{product_id}' "
+                f"AND metadata['billing_interval']:'{billing_interval}'"
+            ),
+            limit=1,
+        )
+        if not prices.data:
+            return None
+
+        price = prices.data[0]
+        return {
+            "success": True,
+            "price": price_to_dict(price),
+            "message": "Price retrieved successfully",
+        }
+
+    def invalidate_plan_cache(self, plan_type: str) -> None:
+        """
+        Drop the cached product and prices of a pricing plan
+
+        Args:
+            plan_type: Pricing plan type to drop
+        """
+        cache.delete(f"stripe:pricing_plan:{plan_type}")
+
+    def get_or_create_plan(
+        self, plan_data: Dict[str, Any], refresh: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the Stripe product and prices of a pricing plan, creating any that are missing
+
+        Resolved plans are cached by plan type, so repeat calls do not hit Stripe.
+
+        Args:
+            plan_data: Pricing plan definition
+            refresh: Look the plan up in Stripe even if it is cached
+
+        Returns:
+            Dict containing the plan's product and prices, or None if the product
+            could not be created
+        """
+        plan_type = plan_data['metadata']['plan_type']
+        cache_key = f"stripe:pricing_plan:{plan_type}"
+        plan = None if refresh else cache.get(cache_key)
+        if plan is not None:
+            return plan
+
+        product_result = self.find_plan_product(plan_type)
+        product_exists = product_result is not None
+        if not product_exists:
+            product_result = self.create_product(
+                name=f"RecruiterAI {plan_data['name']} Plan",
+                description=plan_data['description'],
+                metadata=dict(plan_data['metadata'])
+            )
+
+        if not product_result["success"]:
+            return None
+
+        product_id = product_result["product"]["id"]
+
+        def get_or_create_price(billing_interval, recurring_interval, unit_amount):
+            return (
+                product_exists and self.find_plan_price(product_id, billing_interval)
+            ) or self.create_price(
+                product_id=product_id,
+                unit_amount=unit_amount,
+                recurring_interval=recurring_interval,
+                nickname=f"{plan_data['name']} {billing_interval.title()}",
+                metadata={**plan_data['metadata'], "billing_interval": billing_interval}
+            )
+
+        # Monthly and yearly (30% discount) prices only depend on the product
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            monthly_price_future = executor.submit(
+                get_or_create_price, "monthly", "month", plan_data['monthly_price']
+            )
+            yearly_price_future = executor.submit(
+                get_or_create_price, "yearly", "year", plan_data['yearly_price']
+            )
+            monthly_price_result = monthly_price_future.result()
+            yearly_price_result = yearly_price_future.result()
+
+        plan = {
+            "plan_name": plan_data['name'],
+            "product": product_result["product"],
+            "monthly_price": monthly_price_result.get("price"),
+            "yearly_price": yearly_price_result.get("price"),
+            "features": plan_data['features']
+        }
+
+        # Only cache fully resolved plans so failed price creations are retried
+        if monthly_price_result["success"] and yearly_price_result["success"]:
+            cache.set(cache_key, plan, STRIPE_PLAN_CACHE_TIMEOUT)
+
+        return plan
+
+    def setup_pricing_plans(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Set up the three pricing plans for RecruiterAI
 
+        Args:
+            refresh: Look the plans up in Stripe even if they are cached
+
         Returns:
             Dict containing setup results
         """
         try:
             plans = []
-            
-            # Define pricing plans
-            pricing_plans = [
-                {
-                    "name": "Starter",
-                    "description": "Perfect for small businesses",
-                    "features": [
-                        "36 job posts per year",
-                        "Priority email support", 
-                        "Advanced analytics",
-                        "7-day free trial (1 job post)"
-                    ],
-                    "monthly_price": 18231,  # $182.31 in cents
-                    "yearly_price": 218777,  # $2,187.77 in cents
-                    "metadata": {
-                        "plan_type": "starter",
-                        "job_posts_per_year": "36",
-                        "support_level": "email",
-                        "trial_days": "7"
-                    }
-                },
-                {
-                    "name": "Standard", 
-                    "description": "Perfect for growing teams",
-                    "features": [
-                        "120 job posts per year",
-                        "Priority email support",
-                        "Advanced analytics", 
-                        "Team collaboration tools",
-                        "7-day free trial (1 job post)"
-                    ],
-                    "monthly_price": 24666,  # $246.66 in cents
-                    "yearly_price": 295992,  # $2,959.92 in cents
-                    "metadata": {
-                        "plan_type": "standard",
-                        "job_posts_per_year": "120",
-                        "support_level": "email",
-                        "trial_days": "7"
-                    }
-                },
-                {
-                    "name": "Enterprise",
-                    "description": "Perfect for large organizations", 
-                    "features": [
-                        "360 job posts per year",
-                        "Priority email support",
-                        "Advanced analytics",
-                        "Team collaboration tools", 
-                        "7-day free trial (1 job post)"
-                    ],
-                    "monthly_price": 34318,  # $343.18 in cents
-                    "yearly_price": 411815,  # $4,118.15 in cents
-                    "metadata": {
-                        "plan_type": "enterprise",
-                        "job_posts_per_year": "360", 
-                        "support_level": "email",
-                        "trial_days": "7"
-                    }
-                }
-            ]
-
-            for plan_data in pricing_plans:
-                # Create product
-                product_result = self.create_product(
-                    name=f"RecruiterAI {plan_data['name']} Plan",
-                    description=plan_data['description'],
-                    metadata=plan_data['metadata']
-                )
-                
-                if not product_result["success"]:
-                    continue
-
-                product_id = product_result["product"]["id"]
-                
-                # Create monthly price
-                monthly_price_result = self.create_price(
-                    product_id=product_id,
-                    unit_amount=plan_data['monthly_price'],
-                    recurring_interval="month",
-                    nickname=f"{plan_data['name']} Monthly",
-                    metadata={**plan_data['metadata'], "billing_interval": "monthly"}
-                )
-                
-                # Create yearly price (30% discount)
-                yearly_price_result = self.create_price(
-                    product_id=product_id,
-                    unit_amount=plan_data['yearly_price'],
-                    recurring_interval="year", 
-                    nickname=f"{plan_data['name']} Yearly",
-                    metadata={**plan_data['metadata'], "billing_interval": "yearly"}
-                )
-
-                plans.append({
-                    "plan_name": plan_data['name'],
-                    "product": product_result["product"],
-                    "monthly_price": monthly_price_result.get("price"),
-                    "yearly_price": yearly_price_result.get("price"),
-                    "features": plan_data['features']
-                })
+
+            # Plans are independent, so resolve them concurrently
+            with ThreadPoolExecutor(max_workers=len(PRICING_PLANS)) as executor:
+                for plan in executor.map(
+                    lambda plan_data: self.get_or_create_plan(plan_data, refresh=refresh),
+                    PRICING_PLANS,
+                ):
+                    if plan is not None:
+                        plans.append(plan)
 
             return {
                 "success": True,
@@ -562,5 +769,11 @@ class StripeService:
             }
 
 
-# Global instance
-stripe_service = StripeService()
+@lru_cache(maxsize=1)
+def get_stripe_service() -> StripeService:
+    """Get the shared StripeService instance"""
+    return StripeService()
+
+
+# Global instance, created on first use
+stripe_service = SimpleLazyObject(get_stripe_service)
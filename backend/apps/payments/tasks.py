@@ -0,0 +1,90 @@
+"""
+Background tasks for Stripe Payments
+"""
+
+import logging
+from typing import Optional
+
+from celery import shared_task
+
+from .models import PendingSubscription
+from .stripe_service import stripe_service
+
+logger = logging.getLogger(__name__)
+
+
+# The request row is committed before the task is queued, but retry briefly in case
+# the worker reads from a database that has not caught up yet
+@shared_task(autoretry_for=(PendingSubscription.DoesNotExist,), max_retries=3, retry_backoff=True)
+def create_subscription_task(pending_subscription_id: str, success_message: Optional[str] = None) -> str:
+    """
+    Create the Stripe customer and subscription for a queued subscription request
+
+    Stripe calls reuse idempotency keys derived from the pending subscription ID,
+    so a redelivered task returns the original objects instead of duplicating them.
+    Unexpected errors mark the request failed so clients polling its status finish.
+
+    Args:
+        pending_subscription_id: PendingSubscription ID
+        success_message: Message to store on success instead of the default
+
+    Returns:
+        Final status of the pending subscription
+    """
+    pending = PendingSubscription.objects.get(pk=pending_subscription_id)
+    if pending.status != 'queued':
+        return pending.status
+
+    try:
+        return _create_subscription(pending, success_message)
+    except Exception as e:
+        logger.exception(f"Failed to create subscription for request {pending.id}")
+        pending.status = 'failed'
+        pending.result = {
+            "success": False,
+            "error": str(e),
+            "message": "Failed to create subscription",
+        }
+        pending.save(update_fields=['status', 'result', 'updated_at'])
+        return pending.status
+
+
+def _create_subscription(pending: PendingSubscription, success_message: Optional[str]) -> str:
+    """Run the Stripe calls for a queued subscription request and store the result"""
+    data = pending.request_data
+    idempotency_key = pending.id.hex
+
+    customer_result = stripe_service.create_customer(
+        email=data["customer_email"],
+        name=data.get("customer_name"),
+        metadata=data.get("metadata", {}),
+        idempotency_key=f"{idempotency_key}-customer",
+    )
+
+    if not customer_result["success"]:
+        pending.status = 'failed'
+        pending.result = customer_result
+        pending.save(update_fields=['status', 'result', 'updated_at'])
+        return pending.status
+
+    subscription_result = stripe_service.create_subscription(
+        customer_id=customer_result["customer"]["id"],
+        price_id=data["price_id"],
+        trial_period_days=data.get("trial_period_days", 7),
+        metadata=data.get("metadata", {}),
+        idempotency_key=f"{idempotency_key}-subscription",
+    )
+
+    if subscription_result["success"]:
+        # subscription_result is a fresh dict from the service, so extend it in place
+        subscription_result["customer"] = customer_result["customer"]
+        if success_message:
+            subscription_result["message"] = success_message
+        pending.status = 'succeeded'
+        pending.result = subscription_result
+    else:
+        pending.status = 'failed'
+        pending.result = subscription_result
+
+    pending.save(update_fields=['status', 'result', 'updated_at'])
+    return pending.status
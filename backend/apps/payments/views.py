@@ -3,14 +3,27 @@ Stripe Payment Views
 Django REST Framework views for Stripe payment operations
 """
 
+import hashlib
+import logging
+
+import orjson
+from django.db import transaction
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition, require_POST
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.openapi import OpenApiTypes
 
-from .stripe_service import stripe_service
+from .models import PendingSubscription
+from .renderers import ORJSONRenderer
+from .stripe_service import PRICING_PLANS, PUBLISHABLE_KEY, stripe_service
+from .tasks import create_subscription_task
 from .serializers import (
     CreateProductSerializer,
     UpdateProductSerializer,
@@ -18,11 +31,113 @@ from .serializers import (
     ProductListResponseSerializer,
     DeleteProductResponseSerializer,
     CreateSubscriptionSerializer,
-    PricingPlansResponseSerializer,
-    CreateSubscriptionResponseSerializer,
+    SubscriptionTaskResponseSerializer,
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Responses are plain dicts built by StripeService, so skip the stdlib json encoder
+RENDERER_CLASSES = [ORJSONRenderer, BrowsableAPIRenderer]
+
+# Query parameter values treated as true
+TRUE_VALUES = frozenset({"true", "True", "TRUE", "1", "yes", "Yes", "YES", "t", "T"})
+
+DEFAULT_PRODUCTS_LIMIT = 10
+MAX_PRODUCTS_LIMIT = 100
+
+# Stripe events that change data served from the product cache
+PRODUCT_EVENTS = {"product.created", "product.updated", "product.deleted"}
+
+# Stripe events that can change the product or prices resolved for a pricing plan
+PLAN_EVENTS = PRODUCT_EVENTS | {"price.created", "price.updated", "price.deleted"}
+
+
+# Marketing label shown next to every yearly price
+YEARLY_SAVINGS_LABEL = "Save 30%"
+
+
+def pricing_plan_to_dict(plan):
+    """Build the public representation of a plan from its StripeService definition"""
+    monthly_price = plan["monthly_price"] / 100
+    yearly_price = plan["yearly_price"] / 100
+    metadata = plan["metadata"]
+    return {
+        "name": plan["name"],
+        "description": plan["description"],
+        "monthly_price": monthly_price,
+        "yearly_price": yearly_price,
+        "monthly_price_formatted": f"${monthly_price:,.2f}/month",
+        "yearly_price_formatted": f"${yearly_price:,.2f} a year",
+        "yearly_savings": YEARLY_SAVINGS_LABEL,
+        "features": list(plan["features"]),
+        "metadata": {
+            "plan_type": metadata["plan_type"],
+            "job_posts_per_year": int(metadata["job_posts_per_year"]),
+            "support_level": metadata["support_level"],
+            "trial_days": int(metadata["trial_days"]),
+        },
+    }
+
+
+# Pricing plans shown on the frontend, derived from the plans created in Stripe and
+# serialized once since they only change with the code
+PRICING_PLANS_DATA = [pricing_plan_to_dict(plan) for plan in PRICING_PLANS]
+
+PRICING_PLANS_PAYLOAD = orjson.dumps(
+    {
+        "success": True,
+        "plans": PRICING_PLANS_DATA,
+        "message": "Pricing plans retrieved successfully",
+    }
+)
+PRICING_PLANS_ETAG = f'"{hashlib.md5(PRICING_PLANS_PAYLOAD).hexdigest()}"'
+PRICING_PLANS_MAX_AGE = 60 * 60  # seconds
+
+PRICING_PLANS_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "success": {"type": "boolean"},
+        "plans": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "description": {"type": "string"},
+                    "monthly_price": {"type": "number"},
+                    "yearly_price": {"type": "number"},
+                    "monthly_price_formatted": {"type": "string"},
+                    "yearly_price_formatted": {"type": "string"},
+                    "yearly_savings": {"type": "string"},
+                    "features": {"type": "array", "items": {"type": "string"}},
+                    "metadata": {"type": "object"},
+                },
+            },
+        },
+    },
+}
+
+# Stripe configuration for the frontend, fixed once settings are loaded
+STRIPE_CONFIG_PAYLOAD = orjson.dumps(
+    {
+        "success": True,
+        "publishable_key": PUBLISHABLE_KEY,
+        "message": "Stripe configuration retrieved successfully",
+    }
+)
+STRIPE_CONFIG_MAX_AGE = 60 * 5  # seconds
+
+STRIPE_CONFIG_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "publishable_key": {"type": "string"},
+        "success": {"type": "boolean"},
+        "message": {"type": "string"},
+    },
+}
+
+
 @extend_schema(
     tags=["Stripe Payments"],
     summary="Create Stripe Product",
@@ -31,6 +146,7 @@ from .serializers import (
     responses={201: StripeResponseSerializer, 400: StripeResponseSerializer},
 )
 @api_view(["POST"])
+@renderer_classes(RENDERER_CLASSES)
 @permission_classes([IsAuthenticated])
 def create_product(request):
     """Create a new product in Stripe"""
@@ -80,6 +196,7 @@ def create_product(request):
     responses={200: StripeResponseSerializer, 404: StripeResponseSerializer},
 )
 @api_view(["GET"])
+@renderer_classes(RENDERER_CLASSES)
 @permission_classes([IsAuthenticated])
 def get_product(request, product_id):
     """Retrieve a product from Stripe"""
@@ -108,6 +225,7 @@ def get_product(request, product_id):
     responses={200: StripeResponseSerializer, 400: StripeResponseSerializer},
 )
 @api_view(["PUT", "PATCH"])
+@renderer_classes(RENDERER_CLASSES)
 @permission_classes([IsAuthenticated])
 def update_product(request, product_id):
     """Update a product in Stripe"""
@@ -172,16 +290,22 @@ def update_product(request, product_id):
     responses={200: ProductListResponseSerializer},
 )
 @api_view(["GET"])
+@renderer_classes(RENDERER_CLASSES)
 @permission_classes([IsAuthenticated])
 def list_products(request):
     """List products from Stripe"""
-    limit = int(request.GET.get("limit", 10))
+    try:
+        limit = int(request.GET.get("limit", DEFAULT_PRODUCTS_LIMIT))
+    except ValueError:
+        limit = DEFAULT_PRODUCTS_LIMIT
+    # Stripe accepts 1-100; clamping here also keeps oversized limits on one cache key
+    limit = max(1, min(limit, MAX_PRODUCTS_LIMIT))
     active = request.GET.get("active")
     starting_after = request.GET.get("starting_after")
 
     # Convert active parameter to boolean if provided
     if active is not None:
-        active = active.lower() in ["true", "1", "yes"]
+        active = active in TRUE_VALUES
 
     result = stripe_service.list_products(
         limit=limit,
@@ -208,6 +332,7 @@ def list_products(request):
     responses={200: DeleteProductResponseSerializer, 400: DeleteProductResponseSerializer},
 )
 @api_view(["DELETE"])
+@renderer_classes(RENDERER_CLASSES)
 @permission_classes([IsAuthenticated])
 def delete_product(request, product_id):
     """Delete a product from Stripe"""
@@ -223,203 +348,51 @@ def delete_product(request, product_id):
     tags=["Stripe Payments"],
     summary="Get Stripe Configuration",
     description="Get Stripe publishable key and configuration",
-    responses={
-        200: {
-            "type": "object",
-            "properties": {
-                "publishable_key": {"type": "string"},
-                "success": {"type": "boolean"},
-                "message": {"type": "string"},
-            },
-        }
-    },
+    responses={200: STRIPE_CONFIG_RESPONSE_SCHEMA},
 )
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def get_stripe_config(request):
     """Get Stripe configuration for frontend"""
-    return Response(
-        {
-            "success": True,
-            "publishable_key": stripe_service.publishable_key,
-            "message": "Stripe configuration retrieved successfully",
-        },
-        status=status.HTTP_200_OK,
+    # Set here rather than with cache_control so 401 responses are not cached
+    return HttpResponse(
+        STRIPE_CONFIG_PAYLOAD,
+        content_type="application/json",
+        headers={"Cache-Control": f"private, max-age={STRIPE_CONFIG_MAX_AGE}"},
     )
 
 
-@extend_schema(
-    tags=["Pricing Plans"],
-    summary="Setup Pricing Plans",
-    description="Setup RecruiterAI pricing plans in Stripe (Starter, Standard, Enterprise)",
-    responses={200: PricingPlansResponseSerializer, 400: PricingPlansResponseSerializer},
-)
-@api_view(["POST"])
-@permission_classes([IsAuthenticated])
-def setup_pricing_plans(request):
-    """Setup the three pricing plans in Stripe"""
-    result = stripe_service.setup_pricing_plans()
-    
-    if result["success"]:
-        return Response(result, status=status.HTTP_200_OK)
-    else:
-        return Response(result, status=status.HTTP_400_BAD_REQUEST)
-
-
 @extend_schema(
     tags=["Pricing Plans"],
     summary="Get Pricing Plans",
     description="Get all available pricing plans with their details",
-    responses={
-        200: {
-            "type": "object",
-            "properties": {
-                "success": {"type": "boolean"},
-                "plans": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string"},
-                            "description": {"type": "string"},
-                            "monthly_price": {"type": "number"},
-                            "yearly_price": {"type": "number"},
-                            "monthly_price_formatted": {"type": "string"},
-                            "yearly_price_formatted": {"type": "string"},
-                            "yearly_savings": {"type": "string"},
-                            "features": {"type": "array", "items": {"type": "string"}},
-                            "metadata": {"type": "object"}
-                        }
-                    }
-                }
-            }
-        }
-    },
+    responses={200: PRICING_PLANS_RESPONSE_SCHEMA},
 )
+@cache_control(public=True, max_age=PRICING_PLANS_MAX_AGE)
+@condition(etag_func=lambda request: PRICING_PLANS_ETAG)
 @api_view(["GET"])
 @permission_classes([])  # Public endpoint
 def get_pricing_plans(request):
     """Get pricing plans information for the frontend"""
-    plans_data = [
-        {
-            "name": "Starter",
-            "description": "Perfect for small businesses",
-            "monthly_price": 182.31,
-            "yearly_price": 2187.77,
-            "monthly_price_formatted": "$182.31/month",
-            "yearly_price_formatted": "$2,187.77 a year",
-            "yearly_savings": "Save 30%",
-            "features": [
-                "36 job posts per year",
-                "Priority email support", 
-                "Advanced analytics",
-                "7-day free trial (1 job post)"
-            ],
-            "metadata": {
-                "plan_type": "starter",
-                "job_posts_per_year": 36,
-                "support_level": "email",
-                "trial_days": 7
-            }
-        },
-        {
-            "name": "Standard", 
-            "description": "Perfect for growing teams",
-            "monthly_price": 246.66,
-            "yearly_price": 2959.92,
-            "monthly_price_formatted": "$246.66/month",
-            "yearly_price_formatted": "$2,959.92 a year",
-            "yearly_savings": "Save 30%",
-            "features": [
-                "120 job posts per year",
-                "Priority email support",
-                "Advanced analytics", 
-                "Team collaboration tools",
-                "7-day free trial (1 job post)"
-            ],
-            "metadata": {
-                "plan_type": "standard",
-                "job_posts_per_year": 120,
-                "support_level": "email",
-                "trial_days": 7
-            }
-        },
-        {
-            "name": "Enterprise",
-            "description": "Perfect for large organizations", 
-            "monthly_price": 343.18,
-            "yearly_price": 4118.15,
-            "monthly_price_formatted": "$343.18/month",
-            "yearly_price_formatted": "$4,118.15 a year",
-            "yearly_savings": "Save 30%",
-            "features": [
-                "360 job posts per year",
-                "Priority email support",
-                "Advanced analytics",
-                "Team collaboration tools", 
-                "7-day free trial (1 job post)"
-            ],
-            "metadata": {
-                "plan_type": "enterprise",
-                "job_posts_per_year": 360,
-                "support_level": "email",
-                "trial_days": 7
-            }
-        }
-    ]
-    
-    return Response(
-        {
-            "success": True,
-            "plans": plans_data,
-            "message": "Pricing plans retrieved successfully",
-        },
-        status=status.HTTP_200_OK,
-    )
+    return HttpResponse(PRICING_PLANS_PAYLOAD, content_type="application/json")
 
 
 @extend_schema(
     tags=["Subscriptions"],
     summary="Create Subscription",
-    description="Create a new subscription with 7-day free trial",
+    description="Queue a new subscription with 7-day free trial; poll the status endpoint for the result",
     request=CreateSubscriptionSerializer,
-    responses={201: CreateSubscriptionResponseSerializer, 400: CreateSubscriptionResponseSerializer},
+    responses={202: SubscriptionTaskResponseSerializer, 400: SubscriptionTaskResponseSerializer},
 )
 @api_view(["POST"])
+@renderer_classes(RENDERER_CLASSES)
 @permission_classes([IsAuthenticated])
 def create_subscription(request):
     """Create a subscription with free trial"""
     serializer = CreateSubscriptionSerializer(data=request.data)
 
     if serializer.is_valid():
-        data = serializer.validated_data
-        
-        # Create customer first
-        customer_result = stripe_service.create_customer(
-            email=data["customer_email"],
-            name=data.get("customer_name"),
-            metadata=data.get("metadata", {})
-        )
-        
-        if not customer_result["success"]:
-            return Response(customer_result, status=status.HTTP_400_BAD_REQUEST)
-        
-        # Create subscription with trial
-        subscription_result = stripe_service.create_subscription(
-            customer_id=customer_result["customer"]["id"],
-            price_id=data["price_id"],
-            trial_period_days=data.get("trial_period_days", 7),
-            metadata=data.get("metadata", {})
-        )
-        
-        if subscription_result["success"]:
-            response_data = {
-                **subscription_result,
-                "customer": customer_result["customer"]
-            }
-            return Response(response_data, status=status.HTTP_201_CREATED)
-        else:
-            return Response(subscription_result, status=status.HTTP_400_BAD_REQUEST)
+        return queue_subscription(request, serializer.validated_data)
 
     return Response(
         {
@@ -434,11 +407,12 @@ def create_subscription(request):
 @extend_schema(
     tags=["Subscriptions"],
     summary="Start Free Trial",
-    description="Start a 7-day free trial for new users",
+    description="Queue a 7-day free trial for new users; poll the status endpoint for the result",
     request=CreateSubscriptionSerializer,
-    responses={201: CreateSubscriptionResponseSerializer, 400: CreateSubscriptionResponseSerializer},
+    responses={202: SubscriptionTaskResponseSerializer, 400: SubscriptionTaskResponseSerializer},
 )
 @api_view(["POST"])
+@renderer_classes(RENDERER_CLASSES)
 @permission_classes([IsAuthenticated])
 def start_free_trial(request):
     """Start a free trial subscription"""
@@ -457,34 +431,13 @@ def start_free_trial(request):
             "trial_started": "true",
             "user_id": str(request.user.id) if hasattr(request, 'user') else ""
         })
+        data["metadata"] = metadata
         
-        # Create customer
-        customer_result = stripe_service.create_customer(
-            email=data["customer_email"],
-            name=data.get("customer_name"),
-            metadata=metadata
-        )
-        
-        if not customer_result["success"]:
-            return Response(customer_result, status=status.HTTP_400_BAD_REQUEST)
-        
-        # Create trial subscription
-        subscription_result = stripe_service.create_subscription(
-            customer_id=customer_result["customer"]["id"],
-            price_id=data["price_id"],
-            trial_period_days=7,
-            metadata=metadata
+        return queue_subscription(
+            request,
+            data,
+            success_message="Free trial started successfully! No payment required for 7 days.",
         )
-        
-        if subscription_result["success"]:
-            response_data = {
-                **subscription_result,
-                "customer": customer_result["customer"],
-                "message": "Free trial started successfully! No payment required for 7 days."
-            }
-            return Response(response_data, status=status.HTTP_201_CREATED)
-        else:
-            return Response(subscription_result, status=status.HTTP_400_BAD_REQUEST)
 
     return Response(
         {
@@ -494,3 +447,90 @@ def start_free_trial(request):
         },
         status=status.HTTP_400_BAD_REQUEST,
     )
+
+
+def queue_subscription(request, data, success_message=None):
+    """
+    Queue Stripe customer and subscription creation and respond with its task ID
+
+    The response always reports "queued": with no open transaction or with eager
+    Celery the task may already have finished, so clients poll the status endpoint.
+    """
+    pending = PendingSubscription.objects.create(user=request.user, request_data=data)
+    transaction.on_commit(lambda: create_subscription_task.delay(str(pending.id), success_message))
+
+    return Response(
+        {
+            "success": True,
+            "task_id": str(pending.id),
+            "status": "queued",
+            "message": "Subscription creation queued",
+        },
+        status=status.HTTP_202_ACCEPTED,
+    )
+
+
+@extend_schema(
+    tags=["Subscriptions"],
+    summary="Get Subscription Status",
+    description="Get the status and result of a queued subscription request",
+    responses={200: SubscriptionTaskResponseSerializer, 404: SubscriptionTaskResponseSerializer},
+)
+@api_view(["GET"])
+@renderer_classes(RENDERER_CLASSES)
+@permission_classes([IsAuthenticated])
+def get_subscription_status(request, task_id):
+    """Get the status of a queued subscription request"""
+    try:
+        pending = PendingSubscription.objects.get(pk=task_id, user=request.user)
+    except PendingSubscription.DoesNotExist:
+        return Response(
+            {
+                "success": False,
+                "message": "Subscription request not found",
+            },
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    return Response(
+        {
+            "success": True,
+            "task_id": str(pending.id),
+            "status": pending.status,
+            "result": pending.result,
+            "message": "Subscription status retrieved successfully",
+        },
+        status=status.HTTP_200_OK,
+    )
+
+
+@csrf_exempt
+@require_POST
+def stripe_webhook(request):
+    """Handle Stripe webhooks"""
+    import stripe
+
+    if not stripe_service.webhook_secret:
+        logger.error("Received Stripe webhook but STRIPE_WEBHOOK_SECRET is not set")
+        return JsonResponse({"error": "Webhook secret not configured"}, status=500)
+
+    try:
+        event = stripe.Webhook.construct_event(
+            request.body,
+            request.headers.get("Stripe-Signature", ""),
+            stripe_service.webhook_secret,
+        )
+    except (ValueError, stripe.error.SignatureVerificationError) as e:
+        logger.warning(f"Rejected Stripe webhook: {e}")
+        return JsonResponse({"error": "Invalid webhook"}, status=400)
+
+    if event.type in PRODUCT_EVENTS:
+        stripe_service.invalidate_product_cache(event.data.object.id)
+
+    if event.type in PLAN_EVENTS:
+        plan_type = (event.data.object.get("metadata") or {}).get("plan_type")
+        if plan_type:
+            stripe_service.invalidate_plan_cache(plan_type)
+
+    logger.info(f"Processed Stripe webhook {event.id} - Type: {event.type}")
+    return JsonResponse({"received": True})
@@ -86,6 +86,9 @@ DATABASES = {
         "PASSWORD": config("DB_PASSWORD", default="recruiterAI@12312"),
         "HOST": config("DB_HOST", default="aws-1-ap-southeast-1.pooler.supabase.com"),
         "PORT": config("DB_PORT", default="6543"),
+        # Keep connections open between requests instead of reconnecting over TLS each time
+        "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=600, cast=int),
+        "CONN_HEALTH_CHECKS": True,
         "OPTIONS": {
             "sslmode": config("DB_SSL_MODE", default="require"),
             "connect_timeout": 30,
@@ -97,6 +100,33 @@ DATABASES = {
     }
 }
 
+# Cache
+# Redis is shared between workers; without REDIS_URL each process keeps its own memory cache
+REDIS_URL = config("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Identifier of the deployed build (e.g. the git SHA); cache keys scoped to a
+# release change with it instead of with process start time
+RELEASE = config("RELEASE", default="dev")
+
+# Celery
+# Without a broker, tasks run inline in the calling process
+CELERY_BROKER_URL = config("CELERY_BROKER_URL", default=REDIS_URL)
+CELERY_TASK_ALWAYS_EAGER = not CELERY_BROKER_URL
+CELERY_TASK_ACKS_LATE = True
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -6,16 +6,25 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from django.views.decorators.cache import cache_page
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularSwaggerView,
     SpectacularRedocView,
 )
 
+# Generating the schema walks every view, so outside development serve it from
+# the cache. The key prefix follows RELEASE, so all workers share one entry and
+# a deploy never serves the previous release's schema.
+SCHEMA_CACHE_TIMEOUT = 60 * 60  # seconds
+schema_view = SpectacularAPIView.as_view()
+if not settings.DEBUG:
+    schema_view = cache_page(SCHEMA_CACHE_TIMEOUT, key_prefix=f"schema:{settings.RELEASE}")(schema_view)
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     # API Documentation
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("api/schema/", schema_view, name="schema"),
     path(
         "api/docs/",
         SpectacularSwaggerView.as_view(url_name="schema"),
@@ -0,0 +1,26 @@
+"""
+Gunicorn configuration for RecruiterAI Backend project.
+
+Start with: poetry run gunicorn config.wsgi -c gunicorn.conf.py
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Views mostly wait on Stripe, Supabase and Unipile, so each worker serves
+# requests from a thread pool instead of one at a time.
+# WEB_CONCURRENCY overrides the worker count.
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+
+# Load Django once in the master so workers share its memory copy-on-write
+preload_app = True
+
+timeout = 60
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
@@ -52,13 +52,9 @@ def setup_poetry_project():
     print("🔧 Setting up Poetry project...")
     
     try:
-        # Install dependencies
-        subprocess.run(["poetry", "install"], check=True)
-        print("✅ Dependencies installed successfully")
-        
-        # Install development dependencies
-        subprocess.run(["poetry", "install", "--with", "dev"], check=True)
-        print("✅ Development dependencies installed successfully")
+        # Install main and development dependencies in a single resolve
+        subprocess.run(["poetry", "install", "--with", "dev", "--no-interaction"], check=True)
+        print("✅ Dependencies and development dependencies installed successfully")
         
         return True
         
@@ -82,6 +78,7 @@ DB_PASSWORD=
 DB_HOST=db.ummbhscjtbrynnicptpm.supabase.co
 DB_PORT=5432
 DB_SSL_MODE=require
+DB_CONN_MAX_AGE=600
 
 # Email Settings
 EMAIL_HOST=smtp.gmail.com
@@ -104,12 +101,12 @@ EMAIL_HOST_PASSWORD=your-app-password
 # LINKEDIN_API_KEY=your-linkedin-api-key
 """
     
-    env_file = Path('.env')
-    if not env_file.exists():
-        with open(env_file, 'w') as f:
+    # Exclusive create, so an existing .env is never overwritten
+    try:
+        with open('.env', 'x') as f:
             f.write(env_content)
         print("✅ Created .env file with Supabase configuration")
-    else:
+    except FileExistsError:
         print("ℹ️  .env file already exists")
 
 
@@ -221,6 +218,8 @@ def main():
     print("\nNext steps:")
     print("1. Start the development server:")
     print("   poetry run python manage.py runserver")
+    print("   Or serve it with gunicorn as in production:")
+    print("   poetry run gunicorn config.wsgi -c gunicorn.conf.py")
     print("2. Access the admin interface:")
     print("   http://localhost:8000/admin/")
     print("3. View API documentation:")
@@ -3,9 +3,11 @@
 Seed script to create initial job categories and skills
 """
 
+import argparse
 import os
 import django
 import sys
+from collections import defaultdict
 
 # Setup Django environment
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -13,8 +15,15 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 django.setup()
 
+from django.db import transaction
+from django.utils.text import slugify
+
 from apps.jobs.models import JobCategory, JobSkill
 
+# Rows per INSERT statement when seeding
+SEED_BATCH_SIZE = int(os.environ.get('SEED_BATCH_SIZE', 100))
+
+@transaction.atomic
 def create_categories_and_skills():
     """Create initial job categories and skills"""
     print("🌱 Seeding job categories and skills...")
@@ -63,57 +72,67 @@ def create_categories_and_skills():
         }
     ]
     
-    created_categories = 0
-    created_skills = 0
-    
+    category_count = JobCategory.objects.count()
+    skill_count = JobSkill.objects.count()
+
+    # Insert everything in two batched statements; rows that already exist are skipped
+    JobCategory.objects.bulk_create(
+        [
+            JobCategory(
+                name=category_data['name'],
+                slug=slugify(category_data['name']),
+                description=category_data['description'],
+                is_active=True
+            )
+            for category_data in categories_data
+        ],
+        ignore_conflicts=True,
+        batch_size=SEED_BATCH_SIZE
+    )
+
+    categories = {
+        category.name: category
+        for category in JobCategory.objects.filter(name__in=[c['name'] for c in categories_data])
+    }
+
+    skills = {}
     for category_data in categories_data:
-        # Create or get category
-        category, created = JobCategory.objects.get_or_create(
-            name=category_data['name'],
-            defaults={
-                'description': category_data['description'],
-                'is_active': True
-            }
-        )
-        
-        if created:
-            created_categories += 1
-            print(f"✅ Created category: {category.name}")
-        else:
-            print(f"📋 Category already exists: {category.name}")
-        
-        # Create skills for this category
+        category = categories[category_data['name']]
         for skill_name in category_data['skills']:
-            skill, skill_created = JobSkill.objects.get_or_create(
+            skills.setdefault(skill_name, JobSkill(
                 name=skill_name,
-                defaults={
-                    'category': category,
-                    'is_active': True
-                }
-            )
-            
-            if skill_created:
-                created_skills += 1
-                print(f"  ✅ Created skill: {skill.name}")
-            else:
-                # Update category if skill exists but has no category
-                if not skill.category:
-                    skill.category = category
-                    skill.save()
-                    print(f"  📋 Updated skill category: {skill.name}")
-                else:
-                    print(f"  📋 Skill already exists: {skill.name}")
-    
-    print(f"\n🎉 Seeding completed!")
-    print(f"📊 Created {created_categories} new categories")
-    print(f"🛠️ Created {created_skills} new skills")
-    
+                slug=slugify(skill_name),
+                category=category,
+                is_active=True
+            ))
+
+    JobSkill.objects.bulk_create(
+        skills.values(),
+        ignore_conflicts=True,
+        batch_size=SEED_BATCH_SIZE
+    )
+
+    # Existing skills without a category get the one from this seed in a single UPDATE
+    orphan_skills = list(JobSkill.objects.filter(name__in=skills, category=''))
+    for skill in orphan_skills:
+        skill.category = skills[skill.name].category
+    JobSkill.objects.bulk_update(orphan_skills, ['category'], batch_size=SEED_BATCH_SIZE)
+
+    created_categories = JobCategory.objects.count() - category_count
+    created_skills = JobSkill.objects.count() - skill_count
+
     # Display summary
     total_categories = JobCategory.objects.filter(is_active=True).count()
     total_skills = JobSkill.objects.filter(is_active=True).count()
     
-    print(f"\n📈 Total active categories: {total_categories}")
-    print(f"📈 Total active skills: {total_skills}")
+    print(
+        f"\n🎉 Seeding completed!\n"
+        f"📊 Created {created_categories} new categories\n"
+        f"🛠️ Created {created_skills} new skills\n"
+        f"📋 Updated {len(orphan_skills)} skill categories\n"
+        f"\n📈 Total active categories: {total_categories}\n"
+        f"📈 Total active skills: {total_skills}"
+    )
     
     return True
 
@@ -122,21 +141,29 @@ def list_categories_and_skills():
     print("\n📋 Current Categories and Skills:")
     print("=" * 50)
     
-    categories = JobCategory.objects.filter(is_active=True).prefetch_related('jobskill_set')
+    categories = JobCategory.objects.filter(is_active=True).only('id', 'name', 'description')
+
+    # JobSkill.category holds the category name, so group active skills in one query
+    skills_by_category = defaultdict(list)
+    for skill in JobSkill.objects.filter(is_active=True).only('id', 'name', 'category'):
+        skills_by_category[skill.category].append(skill)
     
+    # Build the listing first and write it out in one go
+    lines = []
     for category in categories:
-        print(f"\n🏷️  {category.name} (ID: {category.id})")
-        print(f"   {category.description}")
+        lines.append(f"\n🏷️  {category.name} (ID: {category.id})")
+        lines.append(f"   {category.description}")
         
-        skills = category.jobskill_set.filter(is_active=True)
+        skills = skills_by_category[category.name]
         if skills:
-            print("   Skills:")
-            for skill in skills:
-                print(f"     • {skill.name} (ID: {skill.id})")
+            lines.append("   Skills:")
+            lines.extend(f"     • {skill.name} (ID: {skill.id})" for skill in skills)
         else:
-            print("   No skills yet")
+            lines.append("   No skills yet")
+
+    print("\n".join(lines))
 
-def main():
+def main(verbose=False):
     """Main function"""
     print("🚀 Job Categories & Skills Seeder")
     print("=" * 50)
@@ -145,16 +172,18 @@ def main():
         # Seed data
         create_categories_and_skills()
         
-        # List current data
-        list_categories_and_skills()
-        
         print("\n✨ Success! You can now use these categories and skills in your job postings.")
-        print("\n📝 API Endpoints to test:")
-        print("  GET /api/jobs/categories/ - List all categories")
-        print("  GET /api/jobs/skills/ - List all skills")
-        print("  GET /api/jobs/skills/by-category/1/ - Get skills by category")
-        print("  POST /api/jobs/categories/create/ - Create new category")
-        print("  POST /api/jobs/skills/create/ - Create new skill")
+
+        # The full listing and endpoint hints are only useful when run by hand
+        if verbose:
+            list_categories_and_skills()
+
+            print("\n📝 API Endpoints to test:")
+            print("  GET /api/jobs/categories/ - List all categories")
+            print("  GET /api/jobs/skills/ - List all skills")
+            print("  GET /api/jobs/skills/by-category/1/ - Get skills by category")
+            print("  POST /api/jobs/categories/create/ - Create new category")
+            print("  POST /api/jobs/skills/create/ - Create new skill")
         
     except Exception as e:
         print(f"❌ Error during seeding: {e}")
@@ -165,4 +194,6 @@ def main():
     return True
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Seed job categories and skills")
+    parser.add_argument('--verbose', action='store_true', help="List all categories and skills after seeding")
+    main(verbose=parser.parse_args().verbose)
@@ -10,24 +10,29 @@ import sys
 from pathlib import Path
 
 
-def run_command(command, description):
-    """Run a command and handle errors"""
+def run_command(command, description, capture_output=True):
+    """Run a command (argument list, no shell) and handle errors
+
+    Pass capture_output=False for slow or interactive commands so their
+    output is streamed to the terminal.
+    """
     print(f"\n🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        subprocess.run(command, check=True, capture_output=capture_output, text=True)
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed: {e}")
-        print(f"Error output: {e.stderr}")
+        if e.stderr:
+            print(f"Error output: {e.stderr}")
         return False
 
 
 def create_directories():
     """Create necessary directories"""
+    # Parent directories such as media/ are created along with their children
     directories = [
         'logs',
-        'media',
         'media/profile_pictures',
         'media/company_logos',
         'media/resumes',
@@ -84,16 +89,16 @@ def main():
     setup_environment()
     
     # Install dependencies
-    if not run_command("pip install -r requirements.txt", "Installing dependencies"):
+    if not run_command(['pip', 'install', '-r', 'requirements.txt'], "Installing dependencies", capture_output=False):
         print("❌ Failed to install dependencies. Please check your Python environment.")
         sys.exit(1)
     
     # Run migrations
-    if not run_command("python manage.py makemigrations", "Creating initial migrations"):
+    if not run_command(['python', 'manage.py', 'makemigrations'], "Creating initial migrations"):
         print("❌ Failed to create migrations.")
         sys.exit(1)
     
-    if not run_command("python manage.py migrate", "Running migrations"):
+    if not run_command(['python', 'manage.py', 'migrate'], "Running migrations"):
         print("❌ Failed to run migrations.")
         sys.exit(1)
     
@@ -102,7 +107,7 @@ def main():
     create_superuser = input().lower().strip()
     
     if create_superuser in ['y', 'yes']:
-        if not run_command("python manage.py createsuperuser", "Creating superuser"):
+        if not run_command(['python', 'manage.py', 'createsuperuser'], "Creating superuser", capture_output=False):
             print("⚠️  Failed to create superuser. You can create one later with:")
             print("   python manage.py createsuperuser")
     
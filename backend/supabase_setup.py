@@ -64,6 +64,7 @@ DB_PASSWORD=recruiterAI@12312
 DB_HOST=db.ummbhscjtbrynnicptpm.supabase.co
 DB_PORT=5432
 DB_SSL_MODE=require
+DB_CONN_MAX_AGE=600
 
 # Email Settings
 EMAIL_HOST=smtp.gmail.com
@@ -10,17 +10,15 @@ import sys
 # Setup Django environment
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Set environment variables for testing
+# Unipile settings are read from .env by python-decouple
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ.setdefault('UNIPILE_API_KEY', 'P0P4J3SX.MX5Dvt2lWBiny9TDqdfRp88uKBEcRFk6TWuMi+5bXiY=')
-os.environ.setdefault('UNIPILE_BASE_URL', 'https://api10.unipile.com:14090/api/v1')
-os.environ.setdefault('UNIPILE_WEBHOOK_URL', 'https://0b72c5ff662f.ngrok-free.app/api/jobs/webhooks')
 
 django.setup()
 
 from apps.jobs.unipile_service import UnipileService
 from apps.jobs.models import JobCategory, JobSkill
 from django.contrib.auth import get_user_model
+from django.db import transaction
 
 User = get_user_model()
 
@@ -43,7 +41,7 @@ def test_unipile_service():
         
         # Test LinkedIn accounts specifically
         print("\n📡 Testing get_linkedin_accounts()...")
-        linkedin_accounts = service.get_linkedin_accounts()
+        linkedin_accounts = service.get_linkedin_accounts(accounts=accounts)
         print(f"✅ Found {len(linkedin_accounts)} LinkedIn accounts")
         
         if linkedin_accounts:
@@ -73,6 +71,7 @@ def test_unipile_service():
     except Exception as e:
         print(f"❌ Error testing Unipile service: {e}")
 
+@transaction.atomic
 def test_database_models():
     """Test database models and relationships"""
     print("\n🧪 Testing Database Models...")
@@ -125,6 +124,7 @@ def test_database_models():
     except Exception as e:
         print(f"❌ Error testing database models: {e}")
 
+@transaction.atomic
 def test_job_creation():
     """Test job creation with sample data"""
     print("\n🧪 Testing Job Creation...")
@@ -174,7 +174,7 @@ def test_job_creation():
         print(f"  - Location: {job.location}")
         print(f"  - Salary: {job.salary_range}")
         print(f"  - Status: {job.status}")
-        print(f"  - Skills: {', '.join([skill.name for skill in job.skills.all()])}")
+        print(f"  - Skills: {', '.join(job.skills.values_list('name', flat=True))}")
         print(f"  - Active: {job.is_active}")
         print(f"  - Can Apply: {job.can_apply()}")
         
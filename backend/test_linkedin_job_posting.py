@@ -5,16 +5,15 @@ Test script for LinkedIn job posting via Unipile API
 
 import os
 import django
+import logging
 import sys
 import json
 
 # Setup Django environment
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Set environment variables
+# Unipile settings are read from .env by python-decouple
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ.setdefault('UNIPILE_API_KEY', 'P0P4J3SX.MX5Dvt2lWBiny9TDqdfRp88uKBEcRFk6TWuMi+5bXiY=')
-os.environ.setdefault('UNIPILE_BASE_URL', 'https://api10.unipile.com:14090/api/v1')
 
 django.setup()
 
@@ -23,6 +22,7 @@ from apps.jobs.models import Job, JobCategory, JobSkill
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
 
 def test_linkedin_job_posting():
     """Test LinkedIn job posting functionality"""
@@ -112,25 +112,26 @@ def test_linkedin_job_posting():
             # Show publish options
             publish_options = create_response.get('publish_options', {})
             if publish_options:
-                print("\n💰 Publishing Options:")
+                lines = ["\n💰 Publishing Options:"]
                 
                 free_option = publish_options.get('free', {})
                 if free_option:
-                    print("  Free Posting:")
-                    print(f"    - Eligible: {free_option.get('eligible', 'N/A')}")
-                    print(f"    - Estimated Monthly Applicants: {free_option.get('estimated_monthly_applicants', 'N/A')}")
+                    lines.append("  Free Posting:")
+                    lines.append(f"    - Eligible: {free_option.get('eligible', 'N/A')}")
+                    lines.append(f"    - Estimated Monthly Applicants: {free_option.get('estimated_monthly_applicants', 'N/A')}")
                     if free_option.get('ineligible_reason'):
-                        print(f"    - Ineligible Reason: {free_option['ineligible_reason']}")
+                        lines.append(f"    - Ineligible Reason: {free_option['ineligible_reason']}")
                 
                 promoted_option = publish_options.get('promoted', {})
                 if promoted_option:
-                    print("  Promoted Posting:")
-                    print(f"    - Estimated Monthly Applicants: {promoted_option.get('estimated_monthly_applicants', 'N/A')}")
-                    print(f"    - Currency: {promoted_option.get('currency', 'N/A')}")
+                    lines.append("  Promoted Posting:")
+                    lines.append(f"    - Estimated Monthly Applicants: {promoted_option.get('estimated_monthly_applicants', 'N/A')}")
+                    lines.append(f"    - Currency: {promoted_option.get('currency', 'N/A')}")
                     
                     daily_budget = promoted_option.get('daily_budget', {})
                     if daily_budget:
-                        print(f"    - Daily Budget: ${daily_budget.get('min', 0)} - ${daily_budget.get('max', 0)} (Recommended: ${daily_budget.get('recommended', 0)})")
+                        lines.append(f"    - Daily Budget: ${daily_budget.get('min', 0)} - ${daily_budget.get('max', 0)} (Recommended: ${daily_budget.get('recommended', 0)})")
+                print("\n".join(lines))
             
             # Test publishing (free option)
             print("\n📤 Publishing job (free option)...")
@@ -173,57 +174,15 @@ def test_linkedin_job_posting():
         
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("LinkedIn job posting test failed")
         return False
 
-def test_job_mapping():
-    """Test job type mapping functions"""
-    print("\n🧪 Testing Job Type Mappings")
-    print("=" * 40)
-    
-    unipile = UnipileService()
-    
-    job_types = ['full_time', 'part_time', 'contract', 'freelance', 'internship', 'remote', 'hybrid']
-    
-    print("Job Type → Workplace | Employment Status")
-    print("-" * 40)
-    
-    for job_type in job_types:
-        workplace = unipile._map_workplace_type(job_type)
-        employment = unipile._map_employment_status(job_type)
-        print(f"{job_type:12} → {workplace:8} | {employment}")
-
-def test_html_formatting():
-    """Test HTML formatting for job descriptions"""
-    print("\n🧪 Testing HTML Formatting")
-    print("=" * 40)
-    
-    unipile = UnipileService()
-    
-    test_text = """• Develop and maintain applications
-• Work with databases
-• Write documentation
-This is a regular paragraph.
-• Another bullet point
-• Final point"""
-    
-    formatted = unipile._format_text_to_html(test_text)
-    print("Original text:")
-    print(test_text)
-    print("\nFormatted HTML:")
-    print(formatted)
-
 def main():
     """Run all tests"""
     print("🚀 LinkedIn Job Posting Test Suite")
     print("=" * 80)
     
-    # Test mappings first
-    test_job_mapping()
-    
-    # Test HTML formatting
-    test_html_formatting()
+    # Mapping and HTML formatting checks live in test_unipile_formatting.py
     
     # Test actual job posting
     success = test_linkedin_job_posting()
@@ -5,20 +5,22 @@ Test script to get LinkedIn location IDs from Unipile API
 
 import os
 import django
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Setup Django environment
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Set environment variables
+# Unipile settings are read from .env by python-decouple
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-os.environ.setdefault('UNIPILE_API_KEY', 'P0P4J3SX.MX5Dvt2lWBiny9TDqdfRp88uKBEcRFk6TWuMi+5bXiY=')
-os.environ.setdefault('UNIPILE_BASE_URL', 'https://api10.unipile.com:14090/api/v1')
 
 django.setup()
 
 from apps.jobs.unipile_service import UnipileService
 
+logger = logging.getLogger(__name__)
+
 def test_linkedin_locations():
     """Test getting LinkedIn location IDs"""
     print("🧪 Testing LinkedIn Location Search")
@@ -44,34 +46,42 @@ def test_linkedin_locations():
         
         # Test getting all location parameters
         print("\n🌍 Getting all LinkedIn location parameters...")
-        locations = unipile.get_linkedin_search_parameters(account_id, "LOCATION")
+        # Only the first 10 are shown, so only fetch that many
+        locations = unipile.get_linkedin_search_parameters(account_id, "LOCATION", limit=10)
         
         if locations:
-            print(f"✅ Found {len(locations)} location parameters:")
+            print(f"✅ Showing {len(locations)} location parameters:")
+            lines = []
             for i, location in enumerate(locations[:10]):  # Show first 10
-                print(f"  {i+1}. ID: {location.get('id', 'N/A')}")
-                print(f"     Name: {location.get('name', 'N/A')}")
-                print(f"     Type: {location.get('type', 'N/A')}")
-                print()
-            
-            if len(locations) > 10:
-                print(f"  ... and {len(locations) - 10} more locations")
+                lines.append(f"  {i+1}. ID: {location.get('id', 'N/A')}")
+                lines.append(f"     Name: {location.get('name', 'N/A')}")
+                lines.append(f"     Type: {location.get('type', 'N/A')}")
+                lines.append("")
+            print("\n".join(lines))
         else:
             print("⚠️  No location parameters found")
         
         # Test searching for specific locations
         test_queries = ["San Francisco", "New York", "London", "Remote"]
         
-        for query in test_queries:
+        # The searches are independent, so run them concurrently and report in order
+        with ThreadPoolExecutor(max_workers=len(test_queries)) as executor:
+            all_results = list(executor.map(
+                lambda query: unipile.search_linkedin_locations(account_id, query, limit=5),
+                test_queries
+            ))
+        
+        for query, search_results in zip(test_queries, all_results):
             print(f"\n🔍 Searching for locations matching: '{query}'")
-            search_results = unipile.search_linkedin_locations(account_id, query)
             
             if search_results:
-                print(f"✅ Found {len(search_results)} matching locations:")
+                print(f"✅ Showing {len(search_results)} matching locations:")
+                lines = []
                 for location in search_results[:5]:  # Show first 5
-                    print(f"  - ID: {location.get('id', 'N/A')}")
-                    print(f"    Name: {location.get('name', 'N/A')}")
-                    print(f"    Type: {location.get('type', 'N/A')}")
+                    lines.append(f"  - ID: {location.get('id', 'N/A')}")
+                    lines.append(f"    Name: {location.get('name', 'N/A')}")
+                    lines.append(f"    Type: {location.get('type', 'N/A')}")
+                print("\n".join(lines))
             else:
                 print(f"⚠️  No locations found for '{query}'")
         
@@ -85,8 +95,7 @@ def test_linkedin_locations():
         
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("LinkedIn location test failed")
         return False
 
 def main():
@@ -7,9 +7,27 @@ Run this script to test your Poetry setup and Supabase connection
 import os
 import sys
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
+def get_poetry_env_path():
+    """Return the Poetry virtual environment path, or None if there is none"""
+    result = subprocess.run(["poetry", "env", "info", "--path"], capture_output=True, text=True)
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return Path(result.stdout.strip()).resolve()
+
+
+def running_in_poetry_env():
+    """Check whether this script already runs on the Poetry interpreter"""
+    try:
+        return get_poetry_env_path() == Path(sys.prefix).resolve()
+    except FileNotFoundError:
+        return False
+
+
 def test_poetry_installation():
     """Test if Poetry is properly installed"""
     print("🧪 Testing Poetry Installation")
@@ -36,15 +54,15 @@ def test_poetry_dependencies():
     
     try:
         # Check if virtual environment exists
-        result = subprocess.run(["poetry", "env", "info"], capture_output=True, text=True)
-        if result.returncode == 0:
+        if get_poetry_env_path():
             print("✅ Poetry virtual environment is set up")
         else:
             print("❌ Poetry virtual environment not found")
             return False
         
         # Check installed packages
-        result = subprocess.run(["poetry", "show"], capture_output=True, text=True)
+        # Only the exit code matters, so discard the package listing
+        result = subprocess.run(["poetry", "show"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         if result.returncode == 0:
             print("✅ Dependencies are installed")
             return True
@@ -63,6 +81,12 @@ def test_django_with_poetry():
     print("=" * 40)
     
     try:
+        # Already on the Poetry interpreter, so skip spawning another one
+        if running_in_poetry_env():
+            import django
+            print(f"✅ Django is working: {django.get_version()}")
+            return True
+        
         # Test Django version
         result = subprocess.run(
             ["poetry", "run", "python", "-c", "import django; print(django.get_version())"],
@@ -87,6 +111,15 @@ def test_supabase_connection():
     print("=" * 40)
     
     try:
+        # Already on the Poetry interpreter, so run the checks in this process
+        if running_in_poetry_env():
+            from test_supabase import test_database_connection, test_django_models
+            if test_database_connection() and test_django_models():
+                print("✅ Supabase connection test passed")
+                return True
+            print("❌ Supabase connection test failed")
+            return False
+        
         # Test database connection
         result = subprocess.run([
             "poetry", "run", "python", "test_supabase.py"
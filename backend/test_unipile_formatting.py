@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for Unipile job mapping and HTML formatting helpers
+
+These helpers are pure functions, so this script runs without Django setup
+or network access.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from apps.jobs.unipile_service import UnipileService
+
+def test_job_mapping():
+    """Test job type mapping functions"""
+    print("\n🧪 Testing Job Type Mappings")
+    print("=" * 40)
+
+    job_types = ['full_time', 'part_time', 'contract', 'freelance', 'internship', 'remote', 'hybrid']
+
+    print("Job Type → Workplace | Employment Status")
+    print("-" * 40)
+
+    for job_type in job_types:
+        workplace = UnipileService._map_workplace_type(job_type)
+        employment = UnipileService._map_employment_status(job_type)
+        print(f"{job_type:12} → {workplace:8} | {employment}")
+
+def test_html_formatting():
+    """Test HTML formatting for job descriptions"""
+    print("\n🧪 Testing HTML Formatting")
+    print("=" * 40)
+
+    test_text = """• Develop and maintain applications
+• Work with databases
+• Write documentation
+This is a regular paragraph.
+• Another bullet point
+• Final point"""
+
+    formatted = UnipileService._format_text_to_html(test_text)
+    print("Original text:")
+    print(test_text)
+    print("\nFormatted HTML:")
+    print(formatted)
+
+def main():
+    """Run all formatting tests"""
+    print("🚀 Unipile Formatting Test Suite")
+    print("=" * 80)
+
+    test_job_mapping()
+    test_html_formatting()
+
+if __name__ == "__main__":
+    main()
@@ -3,40 +3,43 @@
 Test script to verify webhook endpoints are working
 """
 
+import orjson
 import requests
-import json
+
+# Shared session so the OPTIONS and POST checks reuse one connection to the tunnel
+SESSION = requests.Session()
+
+# Test payload (simulating Unipile webhook), serialized once at import
+WEBHOOK_PAYLOAD = orjson.dumps({
+    "id": "test_event_123",
+    "event_type": "account.status_updated",
+    "account_id": "test_account_456",
+    "timestamp": "2025-08-25T17:30:00Z",
+    "data": {
+        "account_id": "test_account_456",
+        "status": "connected",
+        "provider": "linkedin"
+    }
+}, option=orjson.OPT_INDENT_2)
+
+WEBHOOK_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "Unipile-Webhook/1.0"
+}
 
 def test_account_status_webhook():
     """Test the account status webhook endpoint"""
     
     url = "https://0b72c5ff662f.ngrok-free.app/api/jobs/webhooks/account-status/"
     
-    # Test payload (simulating Unipile webhook)
-    test_payload = {
-        "id": "test_event_123",
-        "event_type": "account.status_updated",
-        "account_id": "test_account_456",
-        "timestamp": "2025-08-25T17:30:00Z",
-        "data": {
-            "account_id": "test_account_456",
-            "status": "connected",
-            "provider": "linkedin"
-        }
-    }
-    
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "Unipile-Webhook/1.0"
-    }
-    
     try:
         print("🧪 Testing Account Status Webhook Endpoint")
         print("=" * 50)
         print(f"URL: {url}")
-        print(f"Payload: {json.dumps(test_payload, indent=2)}")
+        print(f"Payload: {WEBHOOK_PAYLOAD.decode()}")
         print()
         
-        response = requests.post(url, json=test_payload, headers=headers, timeout=10)
+        response = SESSION.post(url, data=WEBHOOK_PAYLOAD, headers=WEBHOOK_HEADERS, timeout=10)
         
         print(f"Status Code: {response.status_code}")
         print(f"Response Headers: {dict(response.headers)}")
@@ -70,7 +73,7 @@ def test_options_request():
         print("\n🧪 Testing OPTIONS Request (CORS)")
         print("=" * 50)
         
-        response = requests.options(url, timeout=10)
+        response = SESSION.options(url, timeout=10)
         
         print(f"Status Code: {response.status_code}")
         print(f"Response Headers: {dict(response.headers)}")